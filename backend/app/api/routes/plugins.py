@@ -21,7 +21,8 @@ plugin_manager.loaded_plugins["analytics"] = AnalyticsPlugin()
 plugin_manager.loaded_plugins["social"] = SocialMetaPlugin()
 
 # Enable built-in plugins by default
-plugin_manager.enabled_plugins = ["seo", "analytics", "social"]
+for plugin_name in ("seo", "analytics", "social"):
+    plugin_manager.enable_plugin(plugin_name)
 
 
 class PluginProcessRequest(BaseModel):
@@ -75,7 +76,7 @@ async def list_plugins():
     """
     return {
         "plugins": plugin_manager.list_plugins(),
-        "enabled_plugins": plugin_manager.enabled_plugins,
+        "enabled_plugins": list(plugin_manager.enabled_plugins),
     }
 
 
@@ -204,14 +205,9 @@ from app.modules.plugins.manager import PluginInterface
 from typing import Dict, Any
 
 class Plugin(PluginInterface):
-    def get_name(self) -> str:
-        return "My Custom Plugin"
-    
-    def get_version(self) -> str:
-        return "1.0.0"
-    
-    def get_description(self) -> str:
-        return "Description of what this plugin does"
+    NAME = "My Custom Plugin"
+    VERSION = "1.0.0"
+    DESCRIPTION = "Description of what this plugin does"
     
     def process(self, content: str, options: Dict[str, Any] = None) -> str:
         # Your plugin logic here
@@ -55,6 +55,8 @@ class Settings(BaseSettings):
     # SEO
     DEFAULT_META_TITLE: str = "Generated Page"
     DEFAULT_META_DESCRIPTION: str = "AI Generated HTML Page"
+    SEO_USE_NLTK: bool = False  # NLTK tokenizers instead of the regex ones
+    SEO_ANALYSIS_CACHE_SIZE: int = 128  # 0 disables the advisor result cache
 
     # Plugins
     PLUGINS_DIR: str = "./plugins"
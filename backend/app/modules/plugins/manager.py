@@ -1,34 +1,119 @@
-import importlib
+import asyncio
+import logging
 import os
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    from scandir_rs import Walk
+
+    scandir_rs_available = True
+except ImportError:
+    scandir_rs_available = False
+
+try:
+    import ahocorasick
+
+    ahocorasick_available = True
+except ImportError:
+    ahocorasick_available = False
+
+logger = logging.getLogger(__name__)
+
+# Methods a plugin object must provide; checked instead of isinstance so
+# loading does not go through ABC subclass hooks
+_REQUIRED_PLUGIN_METHODS = ("get_name", "get_version", "get_description", "process")
+
+# Snapshot of the plugins directory used as the discovery cache key:
+# (directory mtime, sorted (subdirectory name, subdirectory mtime) pairs)
+_DiscoveryKey = Tuple[int, Tuple[Tuple[str, int], ...]]
+
+# Mtimes this close to the current time can still change within the same
+# timestamp tick on coarse filesystems (2 s on FAT), so such snapshots are
+# not cached
+_DISCOVERY_RACY_NS = 2_000_000_000
+
+
+class PluginShortCircuit(Exception):
+    """
+    Raised by a plugin to stop the pipeline and return ``payload`` immediately
+    """
+
+    def __init__(self, payload: str):
+        super().__init__("Plugin pipeline short-circuited")
+        self.payload = payload
+
+
+@dataclass(frozen=True, slots=True)
+class PluginMeta:
+    """
+    Static plugin metadata, resolved once per loaded plugin instance
+    """
+
+    name: str
+    version: str
+    description: str
+
+    @classmethod
+    def from_plugin(cls, plugin: "PluginInterface") -> "PluginMeta":
+        return cls(plugin.get_name(), plugin.get_version(), plugin.get_description())
+
+    def to_dict(self, enabled: bool) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "version": self.version,
+            "description": self.description,
+            "enabled": enabled,
+        }
 
 
 class PluginInterface(ABC):
     """
     Base interface for all plugins
+
+    ``process_bytes`` edits UTF-8 encoded content in place for
+    ``process_content_bytes``; the default goes through ``process``, and
+    plugins may override it to splice the bytes directly.
+
+    Static metadata is declared through the NAME, VERSION and DESCRIPTION
+    class attributes; the getters read them and may still be overridden.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
+    NAME: str = ""
+    VERSION: str = ""
+    DESCRIPTION: str = ""
+
     def get_name(self) -> str:
         """Return plugin name"""
-        pass
+        return self.NAME
 
-    @abstractmethod
     def get_version(self) -> str:
         """Return plugin version"""
-        pass
+        return self.VERSION
 
-    @abstractmethod
     def get_description(self) -> str:
         """Return plugin description"""
-        pass
+        return self.DESCRIPTION
 
     @abstractmethod
     def process(self, content: str, options: Dict[str, Any] = None) -> str:
-        """Process content and return modified version"""
+        """
+        Process content and return modified version
+
+        Raise PluginShortCircuit to skip the remaining plugins and return its
+        payload as the final content (e.g. on a cache hit or a safety reject).
+        """
         pass
 
+    def process_bytes(self, data: bytearray, options: Dict[str, Any] = None) -> None:
+        """Modify UTF-8 encoded content in place"""
+        data[:] = self.process(data.decode("utf-8"), options).encode("utf-8")
+
     def initialize(self, config: Dict[str, Any] = None) -> None:
         """Initialize plugin with configuration"""
         pass
@@ -39,10 +124,25 @@ class PluginInterface(ABC):
 
 
 class PluginManager:
-    def __init__(self, plugins_dir: str = "./plugins"):
+    __slots__ = (
+        "plugins_dir",
+        "loaded_plugins",
+        "enabled_plugins",
+        "use_rust",
+        "_discover_cache",
+        "_meta",
+    )
+
+    def __init__(self, plugins_dir: str = "./plugins", use_rust: bool = True):
         self.plugins_dir = plugins_dir
+        # Use scandir-rs (GIL-free, parallel I/O) for discovery when installed
+        self.use_rust = use_rust and scandir_rs_available
         self.loaded_plugins: Dict[str, PluginInterface] = {}
-        self.enabled_plugins: List[str] = []
+        # Insertion-ordered set of enabled plugin names (values unused)
+        self.enabled_plugins: Dict[str, None] = {}
+        self._discover_cache: Optional[Tuple[_DiscoveryKey, List[str]]] = None
+        # Metadata per plugin name, paired with the instance it describes
+        self._meta: Dict[str, Tuple[PluginInterface, PluginMeta]] = {}
 
     def load_plugin(self, plugin_name: str) -> bool:
         """
@@ -51,10 +151,12 @@ class PluginManager:
         try:
             plugin_path = os.path.join(self.plugins_dir, plugin_name)
             if not os.path.exists(plugin_path):
-                print(f"Plugin directory not found: {plugin_path}")
+                logger.warning("Plugin directory not found: %s", plugin_path)
                 return False
 
-            # Import plugin module
+            # Import plugin module (importlib.util is only needed here)
+            import importlib.util
+
             spec = importlib.util.spec_from_file_location(
                 plugin_name, os.path.join(plugin_path, "__init__.py")
             )
@@ -64,21 +166,30 @@ class PluginManager:
             # Get plugin class
             plugin_class = getattr(module, "Plugin", None)
             if not plugin_class:
-                print(f"Plugin class not found in {plugin_name}")
+                logger.warning("Plugin class not found in %s", plugin_name)
                 return False
 
             # Instantiate plugin
             plugin_instance = plugin_class()
-            if not isinstance(plugin_instance, PluginInterface):
-                print(f"Plugin {plugin_name} does not implement PluginInterface")
+            if not all(
+                callable(getattr(plugin_instance, method, None))
+                for method in _REQUIRED_PLUGIN_METHODS
+            ):
+                logger.warning(
+                    "Plugin %s does not implement PluginInterface", plugin_name
+                )
                 return False
 
             self.loaded_plugins[plugin_name] = plugin_instance
-            print(f"Plugin {plugin_name} loaded successfully")
+            self._meta[plugin_name] = (
+                plugin_instance,
+                PluginMeta.from_plugin(plugin_instance),
+            )
+            logger.info("Plugin %s loaded successfully", plugin_name)
             return True
 
-        except Exception as e:
-            print(f"Failed to load plugin {plugin_name}: {e}")
+        except Exception:
+            logger.exception("Failed to load plugin %s", plugin_name)
             return False
 
     def unload_plugin(self, plugin_name: str) -> bool:
@@ -87,13 +198,16 @@ class PluginManager:
         """
         if plugin_name in self.loaded_plugins:
             try:
-                self.loaded_plugins[plugin_name].cleanup()
+                # cleanup() is optional for duck-typed plugins
+                cleanup = getattr(self.loaded_plugins[plugin_name], "cleanup", None)
+                if cleanup is not None:
+                    cleanup()
                 del self.loaded_plugins[plugin_name]
-                if plugin_name in self.enabled_plugins:
-                    self.enabled_plugins.remove(plugin_name)
+                self._meta.pop(plugin_name, None)
+                self.enabled_plugins.pop(plugin_name, None)
                 return True
             except Exception as e:
-                print(f"Failed to unload plugin {plugin_name}: {e}")
+                logger.warning("Failed to unload plugin %s: %s", plugin_name, e)
                 return False
         return False
 
@@ -105,7 +219,7 @@ class PluginManager:
             plugin_name in self.loaded_plugins
             and plugin_name not in self.enabled_plugins
         ):
-            self.enabled_plugins.append(plugin_name)
+            self.enabled_plugins[plugin_name] = None
             return True
         return False
 
@@ -114,10 +228,26 @@ class PluginManager:
         Disable a plugin
         """
         if plugin_name in self.enabled_plugins:
-            self.enabled_plugins.remove(plugin_name)
+            del self.enabled_plugins[plugin_name]
             return True
         return False
 
+    def _plugin_plan(
+        self, plugin_names: Optional[List[str]] = None
+    ) -> List[Tuple[str, PluginInterface]]:
+        """
+        Resolve plugin names to loaded, enabled plugin objects (in order)
+        """
+        loaded = self.loaded_plugins
+        enabled = self.enabled_plugins
+        if plugin_names is None:
+            plugin_names = enabled
+        return [
+            (name, loaded[name])
+            for name in plugin_names
+            if name in loaded and name in enabled
+        ]
+
     def process_content(
         self,
         content: str,
@@ -127,65 +257,299 @@ class PluginManager:
         """
         Process content through specified plugins or all enabled plugins
         """
-        if plugin_names is None:
-            plugin_names = self.enabled_plugins
+        return self._run_plan(self._plugin_plan(plugin_names), content, options)
+
+    def process_batch(
+        self,
+        contents: List[str],
+        plugin_names: List[str] = None,
+        options: Dict[str, Any] = None,
+    ) -> List[tuple[str, List[str]]]:
+        """
+        Process many documents, resolving the plugin plan once for the batch
 
+        Returns one (content, applied_plugins) pair per document, exactly as
+        process_content would for each of them.
+        """
+        plan = self._plugin_plan(plugin_names)
+        return [self._run_plan(plan, content, options) for content in contents]
+
+    def _run_plan(
+        self,
+        plan: List[Tuple[str, PluginInterface]],
+        content: Union[str, bytearray],
+        options: Optional[Dict[str, Any]],
+    ) -> tuple[Union[str, bytearray], List[str]]:
+        """
+        Run content through a resolved plugin plan
+
+        ``content`` is a str, or a bytearray of UTF-8 data that plugins edit
+        in place through process_bytes; the result has the same type. A
+        failing plugin leaves the content unchanged; PluginShortCircuit stops
+        the pipeline and returns its payload.
+        """
+        as_bytes = isinstance(content, bytearray)
         processed_content = content
         applied_plugins = []
 
-        for plugin_name in plugin_names:
-            if (
-                plugin_name in self.loaded_plugins
-                and plugin_name in self.enabled_plugins
-            ):
-                try:
-                    plugin = self.loaded_plugins[plugin_name]
+        for plugin_name, plugin in plan:
+            try:
+                if not as_bytes:
                     processed_content = plugin.process(processed_content, options)
-                    applied_plugins.append(plugin_name)
-                except Exception as e:
-                    print(f"Plugin {plugin_name} failed to process content: {e}")
+                elif hasattr(plugin, "process_bytes"):
+                    plugin.process_bytes(processed_content, options)
+                else:
+                    # Duck-typed plugins get the PluginInterface fallback
+                    PluginInterface.process_bytes(plugin, processed_content, options)
+                applied_plugins.append(plugin_name)
+            except PluginShortCircuit as short_circuit:
+                applied_plugins.append(plugin_name)
+                payload = short_circuit.payload
+                if as_bytes:
+                    payload = bytearray(payload.encode("utf-8"))
+                return payload, applied_plugins
+            except Exception as e:
+                logger.warning(
+                    "Plugin %s failed to process content: %s", plugin_name, e
+                )
 
         return processed_content, applied_plugins
 
+    def process_content_bytes(
+        self,
+        content: bytes,
+        plugin_names: List[str] = None,
+        options: Dict[str, Any] = None,
+    ) -> tuple[bytes, List[str]]:
+        """
+        Process UTF-8 encoded content through specified or all enabled plugins
+
+        Gives the encoded result of process_content for the decoded content.
+        """
+        data, applied_plugins = self._run_plan(
+            self._plugin_plan(plugin_names), bytearray(content), options
+        )
+        return bytes(data), applied_plugins
+
+    async def process_content_async(
+        self,
+        content: str,
+        plugin_names: List[str] = None,
+        options: Dict[str, Any] = None,
+    ) -> tuple[str, List[str]]:
+        """
+        Process content like process_content, for use from async handlers
+
+        The plugin pipeline runs in a worker thread so it does not block the
+        event loop.
+        """
+        return await asyncio.to_thread(
+            self.process_content, content, plugin_names, options
+        )
+
     def get_plugin_info(self, plugin_name: str) -> Optional[Dict[str, str]]:
         """
         Get information about a plugin
         """
-        if plugin_name in self.loaded_plugins:
-            plugin = self.loaded_plugins[plugin_name]
-            return {
-                "name": plugin.get_name(),
-                "version": plugin.get_version(),
-                "description": plugin.get_description(),
-                "enabled": plugin_name in self.enabled_plugins,
-            }
-        return None
+        meta = self.get_plugin_meta(plugin_name)
+        if meta is None:
+            return None
+        return meta.to_dict(plugin_name in self.enabled_plugins)
+
+    def get_plugin_meta(self, plugin_name: str) -> Optional[PluginMeta]:
+        """
+        Get cached static metadata for a loaded plugin
+        """
+        plugin = self.loaded_plugins.get(plugin_name)
+        if plugin is None:
+            return None
+
+        # Plugins may also be registered by assigning into loaded_plugins,
+        # so resolve lazily and re-resolve if the instance was replaced
+        cached = self._meta.get(plugin_name)
+        if cached is None or cached[0] is not plugin:
+            cached = (plugin, PluginMeta.from_plugin(plugin))
+            self._meta[plugin_name] = cached
+        return cached[1]
 
     def list_plugins(self) -> Dict[str, Dict[str, Any]]:
         """
         List all loaded plugins with their information
         """
-        plugins_info = {}
-        for plugin_name in self.loaded_plugins:
-            plugins_info[plugin_name] = self.get_plugin_info(plugin_name)
-        return plugins_info
+        return {
+            plugin_name: self.get_plugin_info(plugin_name)
+            for plugin_name in self.loaded_plugins
+        }
 
     def discover_plugins(self) -> List[str]:
         """
-        Discover available plugins in the plugins directory
+        Discover available plugins in the plugins directory.
+
+        Results are cached until the mtime of the directory or of any of its
+        subdirectories changes; adding or removing a plugin's __init__.py only
+        touches the subdirectory.
+        """
+        try:
+            key = self._discovery_key()
+        except OSError:
+            return []
+
+        if self._discover_cache and self._discover_cache[0] == key:
+            return list(self._discover_cache[1])
+
+        if self.use_rust:
+            discovered = self._scan_plugins_dir_rust()
+        else:
+            discovered = self._scan_plugins_dir()
+
+        newest = max([key[0], *(mtime for _name, mtime in key[1])])
+        if time.time_ns() - newest >= _DISCOVERY_RACY_NS:
+            self._discover_cache = (key, discovered)
+        else:
+            self._discover_cache = None
+        return list(discovered)
+
+    def _discovery_key(self) -> _DiscoveryKey:
+        """
+        Stat the plugins directory and each subdirectory (following symlinks)
+        """
+        root_mtime = os.stat(self.plugins_dir).st_mtime_ns
+        subdirs = []
+        with os.scandir(self.plugins_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        subdirs.append((entry.name, entry.stat().st_mtime_ns))
+                except OSError:
+                    # Broken symlink or entry removed during the scan
+                    continue
+        subdirs.sort()
+        return root_mtime, tuple(subdirs)
+
+    def _scan_plugins_dir(self) -> List[str]:
+        """
+        List plugin packages with a single os.scandir pass
         """
         discovered = []
-        if not os.path.exists(self.plugins_dir):
-            return discovered
+        with os.scandir(self.plugins_dir) as entries:
+            for entry in entries:
+                # is_dir() follows symlinks, so linked plugin packages count
+                if entry.is_dir() and os.path.exists(
+                    os.path.join(entry.path, "__init__.py")
+                ):
+                    discovered.append(entry.name)
+        return discovered
 
-        for item in os.listdir(self.plugins_dir):
-            plugin_path = os.path.join(self.plugins_dir, item)
-            if os.path.isdir(plugin_path) and os.path.exists(
-                os.path.join(plugin_path, "__init__.py")
-            ):
-                discovered.append(item)
+    def _scan_plugins_dir_rust(self) -> List[str]:
+        """
+        List plugin packages using scandir-rs
+        """
+        # Depth 2 covers the plugin directories and their direct files;
+        # roots are relative, so top-level subdirectories have no separator.
+        # Symlinked plugin directories are followed, as in _scan_plugins_dir
+        return [
+            root
+            for root, _dirs, files in Walk(
+                self.plugins_dir, max_depth=2, follow_links=True
+            )
+            if root and os.sep not in root and "__init__.py" in files
+        ]
 
-        return discovered
+    def invalidate_discovery(self) -> None:
+        """
+        Drop cached discovery results (e.g. after writing a new plugin)
+        """
+        self._discover_cache = None
+
+
+# Head injection helpers shared by the built-in plugins
+_VIEWPORT_META = (
+    '<meta name="viewport" content="width=device-width, initial-scale=1.0">'
+)
+_CHARSET_META = '<meta charset="UTF-8">'
+
+# Markers SEOPlugin looks for; located together in one pass over the document
+_SEO_MARKERS = ("<head>", "viewport", "charset")
+
+if ahocorasick_available:
+    _SEO_MARKER_AUTOMATON = ahocorasick.Automaton()
+    for _marker in _SEO_MARKERS:
+        _SEO_MARKER_AUTOMATON.add_word(_marker, _marker)
+    _SEO_MARKER_AUTOMATON.make_automaton()
+
+
+def _scan_seo_markers(content: str) -> Dict[str, int]:
+    """Return the first offset of each SEO marker present in content"""
+    found: Dict[str, int] = {}
+    if ahocorasick_available:
+        for end, marker in _SEO_MARKER_AUTOMATON.iter(content):
+            if marker not in found:
+                found[marker] = end - len(marker) + 1
+                if len(found) == len(_SEO_MARKERS):
+                    break
+    else:
+        for marker in _SEO_MARKERS:
+            idx = content.find(marker)
+            if idx != -1:
+                found[marker] = idx
+    return found
+
+
+def _inject_before_head_close(content: str, snippet: str) -> str:
+    """Insert snippet right before the first </head> tag (single scan, single copy)"""
+    idx = content.find("</head>")
+    if idx == -1:
+        return content
+    return content[:idx] + snippet + content[idx:]
+
+
+_ANALYTICS_TEMPLATE = """
+        <!-- Global site tag (gtag.js) - Google Analytics -->
+        <script async src="https://www.googletagmanager.com/gtag/js?id={tracking_id}"></script>
+        <script>
+          window.dataLayer = window.dataLayer || [];
+          function gtag(){{dataLayer.push(arguments);}}
+          gtag('js', new Date());
+          gtag('config', '{tracking_id}');
+        </script>
+        """
+
+_SOCIAL_META_TEMPLATE = """
+        <!-- Open Graph / Facebook -->
+        <meta property="og:type" content="website">
+        <meta property="og:url" content="{url}">
+        <meta property="og:title" content="{title}">
+        <meta property="og:description" content="{description}">
+        <meta property="og:image" content="{image}">
+
+        <!-- Twitter -->
+        <meta property="twitter:card" content="summary_large_image">
+        <meta property="twitter:url" content="{url}">
+        <meta property="twitter:title" content="{title}">
+        <meta property="twitter:description" content="{description}">
+        <meta property="twitter:image" content="{image}">
+        """
+
+
+@lru_cache(maxsize=256)
+def _render_analytics(tracking_id: str) -> str:
+    """Render the analytics snippet once per tracking id"""
+    return _ANALYTICS_TEMPLATE.format(tracking_id=tracking_id)
+
+
+@lru_cache(maxsize=256)
+def _render_social_meta(title: str, description: str, image: str, url: str) -> str:
+    """Render the social meta snippet once per distinct set of values"""
+    return _SOCIAL_META_TEMPLATE.format(
+        title=title, description=description, image=image, url=url
+    )
+
+
+def _splice_before_head_close(data: bytearray, snippet: str) -> None:
+    """Insert snippet before the first </head> of UTF-8 data, in place"""
+    idx = data.find(b"</head>")
+    if idx != -1:
+        data[idx:idx] = snippet.encode("utf-8")
 
 
 # Built-in plugins
@@ -194,37 +558,49 @@ class SEOPlugin(PluginInterface):
     Built-in SEO enhancement plugin
     """
 
-    def get_name(self) -> str:
-        return "SEO Enhancer"
+    __slots__ = ()
 
-    def get_version(self) -> str:
-        return "1.0.0"
-
-    def get_description(self) -> str:
-        return "Enhances HTML with SEO optimizations"
+    NAME = "SEO Enhancer"
+    VERSION = "1.0.0"
+    DESCRIPTION = "Enhances HTML with SEO optimizations"
 
     def process(self, content: str, options: Dict[str, Any] = None) -> str:
         """
         Add SEO enhancements to HTML content
         """
-        if not options:
-            options = {}
+        markers = _scan_seo_markers(content)
 
-        # Add meta viewport if not present
-        if "viewport" not in content:
-            viewport_meta = (
-                '<meta name="viewport" content="width=device-width, initial-scale=1.0">'
-            )
-            if "<head>" in content:
-                content = content.replace("<head>", f"<head>\n    {viewport_meta}")
+        # Nothing to do without a <head> or when both tags are already present
+        if "<head>" not in markers or ("charset" in markers and "viewport" in markers):
+            return content
 
-        # Add charset if not present
-        if "charset" not in content:
-            charset_meta = '<meta charset="UTF-8">'
-            if "<head>" in content:
-                content = content.replace("<head>", f"<head>\n    {charset_meta}")
+        # Add charset and meta viewport if not present, in a single splice
+        inject = ""
+        if "charset" not in markers:
+            inject += f"\n    {_CHARSET_META}"
+        if "viewport" not in markers:
+            inject += f"\n    {_VIEWPORT_META}"
 
-        return content
+        idx = markers["<head>"] + len("<head>")
+        return content[:idx] + inject + content[idx:]
+
+    def process_bytes(self, data: bytearray, options: Dict[str, Any] = None) -> None:
+        """
+        Add SEO enhancements to UTF-8 encoded HTML in place
+        """
+        idx = data.find(b"<head>")
+        if idx == -1:
+            return
+
+        inject = ""
+        if data.find(b"charset") == -1:
+            inject += f"\n    {_CHARSET_META}"
+        if data.find(b"viewport") == -1:
+            inject += f"\n    {_VIEWPORT_META}"
+
+        if inject:
+            idx += len(b"<head>")
+            data[idx:idx] = inject.encode("utf-8")
 
 
 class AnalyticsPlugin(PluginInterface):
@@ -232,39 +608,38 @@ class AnalyticsPlugin(PluginInterface):
     Built-in analytics plugin
     """
 
-    def get_name(self) -> str:
-        return "Analytics Injector"
+    __slots__ = ()
 
-    def get_version(self) -> str:
-        return "1.0.0"
+    NAME = "Analytics Injector"
+    VERSION = "1.0.0"
+    DESCRIPTION = "Injects analytics tracking code"
 
-    def get_description(self) -> str:
-        return "Injects analytics tracking code"
+    def render_snippet(self, options: Dict[str, Any] = None) -> str:
+        """
+        Build the analytics snippet, or an empty string when not configured
+        """
+        if not options or "tracking_id" not in options:
+            return ""
+
+        return _render_analytics(str(options["tracking_id"]))
 
     def process(self, content: str, options: Dict[str, Any] = None) -> str:
         """
         Add analytics tracking code
         """
-        if not options or "tracking_id" not in options:
+        analytics_script = self.render_snippet(options)
+        if not analytics_script:
             return content
 
-        tracking_id = options["tracking_id"]
+        return _inject_before_head_close(content, f"{analytics_script}\n")
 
-        analytics_script = f"""
-        <!-- Global site tag (gtag.js) - Google Analytics -->
-        <script async src="https://www.googletagmanager.com/gtag/js?id={tracking_id}"></script>
-        <script>
-          window.dataLayer = window.dataLayer || [];
-          function gtag(){{dataLayer.push(arguments);}}
-          gtag('js', new Date());
-          gtag('config', '{tracking_id}');
-        </script>
+    def process_bytes(self, data: bytearray, options: Dict[str, Any] = None) -> None:
         """
-
-        if "</head>" in content:
-            content = content.replace("</head>", f"{analytics_script}\n</head>")
-
-        return content
+        Add analytics tracking code to UTF-8 encoded HTML in place
+        """
+        analytics_script = self.render_snippet(options)
+        if analytics_script:
+            _splice_before_head_close(data, f"{analytics_script}\n")
 
 
 class SocialMetaPlugin(PluginInterface):
@@ -272,44 +647,40 @@ class SocialMetaPlugin(PluginInterface):
     Built-in social media meta tags plugin
     """
 
-    def get_name(self) -> str:
-        return "Social Meta Tags"
-
-    def get_version(self) -> str:
-        return "1.0.0"
+    __slots__ = ()
 
-    def get_description(self) -> str:
-        return "Adds Open Graph and Twitter Card meta tags"
+    NAME = "Social Meta Tags"
+    VERSION = "1.0.0"
+    DESCRIPTION = "Adds Open Graph and Twitter Card meta tags"
 
-    def process(self, content: str, options: Dict[str, Any] = None) -> str:
+    def render_snippet(self, options: Dict[str, Any] = None) -> str:
         """
-        Add social media meta tags
+        Build the Open Graph / Twitter Card snippet
         """
         if not options:
             options = {}
 
-        title = options.get("title", "Default Title")
-        description = options.get("description", "Default Description")
-        image = options.get("image", "")
-        url = options.get("url", "")
-
-        social_meta = f"""
-        <!-- Open Graph / Facebook -->
-        <meta property="og:type" content="website">
-        <meta property="og:url" content="{url}">
-        <meta property="og:title" content="{title}">
-        <meta property="og:description" content="{description}">
-        <meta property="og:image" content="{image}">
+        return _render_social_meta(
+            str(options.get("title", "Default Title")),
+            str(options.get("description", "Default Description")),
+            str(options.get("image", "")),
+            str(options.get("url", "")),
+        )
 
-        <!-- Twitter -->
-        <meta property="twitter:card" content="summary_large_image">
-        <meta property="twitter:url" content="{url}">
-        <meta property="twitter:title" content="{title}">
-        <meta property="twitter:description" content="{description}">
-        <meta property="twitter:image" content="{image}">
+    def process(self, content: str, options: Dict[str, Any] = None) -> str:
         """
+        Add social media meta tags
+        """
+        # Check for </head> first so documents without one skip rendering
+        idx = content.find("</head>")
+        if idx == -1:
+            return content
 
-        if "</head>" in content:
-            content = content.replace("</head>", f"{social_meta}\n</head>")
+        social_meta = self.render_snippet(options)
+        return content[:idx] + f"{social_meta}\n" + content[idx:]
 
-        return content
+    def process_bytes(self, data: bytearray, options: Dict[str, Any] = None) -> None:
+        """
+        Add social media meta tags to UTF-8 encoded HTML in place
+        """
+        _splice_before_head_close(data, f"{self.render_snippet(options)}\n")
@@ -1,26 +1,351 @@
 import re
+import copy
+import math
 import json
-from typing import Any, Dict, List, Optional, Tuple
-from collections import Counter
-from urllib.parse import urlparse
+import heapq
+import hashlib
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass, replace
 
-from bs4 import BeautifulSoup
-import nltk
-from textstat import flesch_reading_ease, flesch_kincaid_grade
+from bs4 import BeautifulSoup, Tag
+from pyphen import Pyphen
+
+from app.core.config import settings
+from app.modules.seo._stopwords import STOPWORDS_EN
 
-# Download required NLTK data if not already present
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+    import ahocorasick
+
+    ahocorasick_available = True
+except ImportError:
+    ahocorasick_available = False
 
 try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+    import numpy as np
+
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+# NLTK-токенизаторы (Punkt) точнее, но заметно медленнее регулярных выражений
+USE_NLTK = settings.SEO_USE_NLTK
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+_SENT_RE = re.compile(r"[^.!?\s][^.!?]*(?:[.!?]+|$)")
+_HEADING_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6"]
+_HEADING_NAMES = frozenset(_HEADING_TAGS)
+# Ссылки, начинающиеся с http, считаются внешними; группа — домен (netloc)
+_URL_RE = re.compile(r"http(?:s?://([^/?#]*))?")
+_OG_RE = re.compile(r"^og:")
+_TWITTER_RE = re.compile(r"^twitter:")
+
+if USE_NLTK:
+    import nltk
+
+    # Download required NLTK data if not already present
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt')
+
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+
+    from nltk.corpus import stopwords
+    from nltk.tokenize import word_tokenize as tokenize_words, sent_tokenize as tokenize_sentences
+
+    STOP_WORDS = frozenset(stopwords.words('english'))
+else:
+    tokenize_words = _WORD_RE.findall
+    tokenize_sentences = _SENT_RE.findall
+    STOP_WORDS = STOPWORDS_EN
+
+try:
+    import lxml  # noqa: F401
+
+    lxml_available = True
+except ImportError:
+    lxml_available = False
+
+# lxml строит дерево на C и заметно быстрее встроенного html.parser
+HTML_PARSER = "lxml" if lxml_available else "html.parser"
+
+
+# При меньшем числе ключевых слов отдельные str.count/str.find быстрее
+# прохода автомата Ахо-Корасик даже с готовым автоматом
+_AUTOMATON_MIN_KEYWORDS = 16
+
+
+@lru_cache(maxsize=128)
+def _keyword_automaton(keywords: Tuple[str, ...]) -> "ahocorasick.Automaton":
+    """Автомат Ахо-Корасик для набора непустых ключевых слов (строится один раз)"""
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def _scan_keywords(text: str, keywords: Tuple[str, ...]) -> Dict[str, Tuple[int, int]]:
+    """
+    Число непересекающихся вхождений и позиция первого вхождения каждого
+    ключевого слова в text (как str.count / str.find) за один проход
+    """
+    found = {kw: (0, -1) for kw in keywords}
+    if not ahocorasick_available or len(found) < _AUTOMATON_MIN_KEYWORDS:
+        for kw in found:
+            found[kw] = (text.count(kw), text.find(kw))
+        return found
+
+    if "" in found:
+        found[""] = (text.count(""), text.find(""))
+    automaton = _keyword_automaton(tuple(kw for kw in found if kw))
+
+    # Совпадения приходят в порядке позиции конца; вхождение, которое
+    # пересекается с предыдущим засчитанным, str.count бы пропустил
+    next_free = {}
+    for end, kw in automaton.iter(text):
+        start = end - len(kw) + 1
+        if start < next_free.get(kw, 0):
+            continue
+        next_free[kw] = end + 1
+        count, first = found[kw]
+        found[kw] = (count + 1, start if first == -1 else first)
+    return found
+
+
+_HYPHENATOR = Pyphen(lang="en_US")
+
+
+def _index_tags(soup: BeautifulSoup) -> Tuple[Dict[str, List[Tag]], List[Tag]]:
+    """
+    Один обход дерева: теги по имени (в порядке документа) и отдельно
+    заголовки h1-h6 в общем порядке документа. Анализаторы берут нужные
+    теги из индекса вместо отдельного find_all на каждый запрос
+    """
+    tags = defaultdict(list)
+    headings = []
+    for element in soup.descendants:
+        if isinstance(element, Tag):
+            name = element.name
+            tags[name].append(element)
+            if name in _HEADING_NAMES:
+                headings.append(element)
+    return tags, headings
+
+
+@lru_cache(maxsize=4096)
+def _syllable_count(word: str) -> int:
+    """Число слогов в слове по словарю переносов (как в textstat)"""
+    return len(_HYPHENATOR.positions(word)) + 1
+
+
+# Подсчет как в textstat: пунктуация, включая дефисы и апострофы, удаляется
+# до разбиения по пробелам, поэтому "seo-friendly" и "don't" — одно слово
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_TEXTSTAT_SENT_RE = re.compile(r"\b[^.!?]+[.!?]*")
+
+
+def _textstat_round(number: float, points: int) -> float:
+    """Округление половин от нуля, как в textstat (round() округляет к четному)"""
+    p = 10 ** points
+    return math.floor(number * p + math.copysign(0.5, number)) / p
+
+
+def _readability_scores(text: str) -> Tuple[float, float]:
+    """
+    Flesch Reading Ease и Flesch-Kincaid Grade текста; слова, предложения,
+    слоги и округление считаются как в textstat, но слоги каждого
+    различного слова определяются один раз
+    """
+    if not text:
+        return 0, 0
+    
+    total_words = len(_PUNCT_RE.sub("", text).split())
+    # Предложения из двух слов и короче textstat не учитывает
+    total_sentences = max(1, sum(
+        1 for sentence in _TEXTSTAT_SENT_RE.findall(text)
+        if len(_PUNCT_RE.sub("", sentence).split()) > 2
+    ))
+    
+    words_per_sentence = _textstat_round(total_words / total_sentences, 1)
+    syllables_per_word = 0.0
+    if total_words:
+        syllables = sum(map(_syllable_count, _PUNCT_RE.sub("", text.lower()).split()))
+        syllables_per_word = _textstat_round(syllables / total_words, 1)
+    
+    reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+    grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    return _textstat_round(reading_ease, 2), _textstat_round(grade, 1)
+
+
+@dataclass(frozen=True, slots=True)
+class Recommendation:
+    """Рекомендация по SEO; в результат анализа попадает как словарь"""
+
+    type: str
+    category: str
+    impact: str
+    issue: str = ""
+    recommendation: str = ""
+    example: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, str]:
+        rec = {
+            "type": self.type,
+            "category": self.category,
+            "issue": self.issue,
+            "recommendation": self.recommendation,
+        }
+        if self.example is not None:
+            rec["example"] = self.example
+        rec["impact"] = self.impact
+        return rec
+
+
+# Шаблоны рекомендаций. Неизменяемые рекомендации добавляются как есть,
+# шаблоны с динамическими полями копируются через replace(шаблон, поле=...)
+_REC_TITLE_MISSING = Recommendation(
+    type="critical",
+    category="title",
+    issue="Отсутствует тег title",
+    recommendation="Добавьте уникальный и описательный тег title",
+    example="<title>Ваш основной заголовок - Название сайта</title>",
+    impact="high"
+)
+_REC_TITLE_LENGTH = Recommendation(type="warning", category="title", impact="medium")
+_REC_TITLE_KEYWORDS = Recommendation(
+    type="suggestion",
+    category="title",
+    issue="Ключевые слова не используются в title",
+    recommendation="Включите основное ключевое слово в начало title",
+    impact="medium"
+)
+_REC_META_DESC_MISSING = Recommendation(
+    type="critical",
+    category="meta_description",
+    issue="Отсутствует meta description",
+    recommendation="Добавьте уникальное и привлекательное описание страницы",
+    example='<meta name="description" content="Краткое описание содержимого страницы">',
+    impact="high"
+)
+_REC_META_DESC_SHORT = Recommendation(type="warning", category="meta_description", impact="medium")
+_REC_H1_MISSING = Recommendation(
+    type="critical",
+    category="headings",
+    recommendation="Добавьте единственный H1 заголовок, описывающий основную тему страницы",
+    example="<h1>Основной заголовок страницы</h1>",
+    impact="high"
+)
+_REC_H1_MULTIPLE = Recommendation(
+    type="warning",
+    category="headings",
+    recommendation="Используйте только один H1 заголовок на странице",
+    impact="medium"
+)
+_REC_KEYWORD_LOW_DENSITY = Recommendation(type="suggestion", category="keywords", impact="medium")
+_REC_KEYWORD_HIGH_DENSITY = Recommendation(type="warning", category="keywords", impact="medium")
+_REC_KEYWORD_STUFFING = Recommendation(
+    type="warning",
+    category="keywords",
+    issue="Высокий риск переспама ключевых слов",
+    recommendation="Используйте синонимы и связанные термины для естественного текста",
+    impact="high"
+)
+_REC_LOW_READABILITY = Recommendation(
+    type="suggestion",
+    category="readability",
+    recommendation="Упростите текст: используйте короткие предложения и простые слова",
+    impact="medium"
+)
+_REC_LONG_SENTENCES = Recommendation(type="suggestion", category="readability", impact="medium")
+_REC_FEW_INTERNAL_LINKS = Recommendation(
+    type="suggestion",
+    category="linking",
+    recommendation="Добавьте 3-5 внутренних ссылок на связанные страницы",
+    impact="medium"
+)
+_REC_ANCHOR_KEYWORDS = Recommendation(
+    type="suggestion",
+    category="linking",
+    issue="Ключевые слова не используются в якорном тексте ссылок",
+    recommendation="Используйте ключевые слова в тексте внутренних ссылок",
+    impact="low"
+)
+_REC_VIEWPORT = Recommendation(
+    type="warning",
+    category="technical",
+    issue="Отсутствует viewport meta тег",
+    recommendation="Добавьте viewport meta тег для мобильной адаптации",
+    example='<meta name="viewport" content="width=device-width, initial-scale=1.0">',
+    impact="high"
+)
+_REC_LANG = Recommendation(
+    type="warning",
+    category="technical",
+    issue="Отсутствует атрибут lang у тега html",
+    recommendation="Добавьте атрибут lang для указания языка страницы",
+    example='<html lang="ru">',
+    impact="medium"
+)
+_REC_STRUCTURED_DATA = Recommendation(
+    type="suggestion",
+    category="technical",
+    issue="Отсутствуют структурированные данные",
+    recommendation="Добавьте JSON-LD разметку для лучшего понимания поисковиками",
+    impact="medium"
+)
+_REC_IMAGES_ALT = Recommendation(
+    type="warning",
+    category="images",
+    recommendation="Добавьте описательные alt атрибуты ко всем изображениям",
+    example='<img src="image.jpg" alt="Описание изображения">',
+    impact="medium"
+)
+
+# Тексты рекомендаций, зависящие только от пороговых значений анализатора;
+# форматируются один раз на набор порогов через _threshold_message
+_MSG_TITLE_EXPAND = "Расширьте title до {}-{} символов"
+_MSG_TITLE_SHORTEN = "Сократите title до {} символов или менее"
+_MSG_META_DESC_EXPAND = "Расширьте до {}-{} символов"
+_MSG_DENSITY_RAISE = "Увеличьте использование ключевого слова до {}-{}%"
+_MSG_DENSITY_LOWER = "Снизьте использование ключевого слова до {}% или менее"
+_MSG_SENTENCES_SHORTEN = "Сократите предложения до {} слов или менее"
+
+
+@lru_cache(maxsize=64)
+def _threshold_message(template: str, *bounds) -> str:
+    """Текст рекомендации для заданных порогов"""
+    return template.format(*bounds)
 
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
+
+# Порядок сортировки рекомендаций: тип в старших битах, влияние — в младших
+_PRIORITY_ORDER = {"critical": 0, "warning": 1, "suggestion": 2}
+_IMPACT_ORDER = {"high": 0, "medium": 1, "low": 2}
+_REC_ORDER = {
+    (rec_type, impact): (priority << 2) | impact_rank
+    for rec_type, priority in _PRIORITY_ORDER.items()
+    for impact, impact_rank in _IMPACT_ORDER.items()
+}
+
+# Штраф к общей оценке за риск переспама ключевых слов
+_STUFFING_PENALTY = {"high": 20, "medium": 10}
+
+# Целевой Flesch Reading Ease по аудитории (для прочих аудиторий — 70)
+_TARGET_SCORE = {"general": 60, "professional": 50}
+
+
+def _rec_order(rec: "Recommendation") -> int:
+    """Ключ сортировки рекомендации"""
+    key = (rec.type, rec.impact)
+    order = _REC_ORDER.get(key)
+    if order is None:
+        order = (_PRIORITY_ORDER.get(key[0], 3) << 2) | _IMPACT_ORDER.get(key[1], 3)
+    return order
 
 
 class SEOAdvisor:
@@ -29,8 +354,9 @@ class SEOAdvisor:
     """
     
     def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
+        self.stop_words = STOP_WORDS
         self.target_keywords = []
+        self._keywords_lower = ()
         
         # SEO константы
         self.IDEAL_TITLE_LENGTH = (30, 60)
@@ -42,35 +368,80 @@ class SEOAdvisor:
         self.MAX_SENTENCE_LENGTH = 20  # слов
         self.IDEAL_PARAGRAPH_LENGTH = (50, 150)  # слов
         
+        # Кэш результатов для повторного анализа тех же страниц (LRU)
+        self.ANALYSIS_CACHE_SIZE = settings.SEO_ANALYSIS_CACHE_SIZE
+        self._analysis_cache: OrderedDict = OrderedDict()
+        
     def analyze_and_recommend(
         self, 
         html: str, 
         target_keywords: Optional[List[str]] = None,
-        target_audience: str = "general"
+        target_audience: str = "general",
+        soup: Optional[BeautifulSoup] = None
     ) -> Dict[str, Any]:
         """
         Комплексный анализ HTML с генерацией персонализированных SEO рекомендаций
+        
+        soup — уже разобранное дерево этого же html, чтобы не разбирать его
+        повторно; само дерево не изменяется
         """
         self.target_keywords = target_keywords or []
-        soup = BeautifulSoup(html, "html.parser")
+        self._keywords_lower = tuple(kw.lower() for kw in self.target_keywords)
+        
+        # Анализ детерминирован по (html, ключевые слова, аудитория), поэтому
+        # повторные запросы отдаются из кэша; наружу уходит копия, чтобы
+        # изменения результата вызывающим кодом не портили кэш
+        if self.ANALYSIS_CACHE_SIZE <= 0:
+            return self._analyze(html, target_audience, soup)
+        
+        cache_key = (
+            hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+            tuple(self.target_keywords),
+            target_audience,
+        )
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+        
+        # При промахе копия уходит в кэш, а свежий результат — вызывающему
+        result = self._analyze(html, target_audience, soup)
+        self._analysis_cache[cache_key] = copy.deepcopy(result)
+        if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        return result
+    
+    def _analyze(
+        self, html: str, target_audience: str, soup: Optional[BeautifulSoup] = None
+    ) -> Dict[str, Any]:
+        """Полный анализ страницы для текущих target_keywords"""
+        owns_soup = soup is None
+        if owns_soup:
+            soup = BeautifulSoup(html, HTML_PARSER)
+        
+        # Текст и токены извлекаются один раз для всех анализаторов
+        text, words, sentences = self._extract_text(soup)
+        
+        # Индекс тегов строится одним обходом и заменяет find_all в анализаторах
+        tags, heading_tags = _index_tags(soup)
         
         # Базовый анализ
-        basic_analysis = self._basic_seo_analysis(soup)
+        basic_analysis = self._basic_seo_analysis(soup, tags, heading_tags)
         
         # Анализ ключевых слов
-        keyword_analysis = self._analyze_keywords(soup)
+        keyword_analysis = self._analyze_keywords(tags, text, words)
         
         # Анализ читаемости
-        readability_analysis = self._analyze_readability(soup)
+        readability_analysis = self._analyze_readability(tags, text, sentences, words)
         
         # Анализ структуры контента
-        structure_analysis = self._analyze_content_structure(soup)
+        structure_analysis = self._analyze_content_structure(tags, heading_tags)
         
         # Анализ внутренней перелинковки
-        linking_analysis = self._analyze_internal_linking(soup)
+        linking_analysis = self._analyze_internal_linking(tags, text)
         
         # Технический SEO анализ
-        technical_analysis = self._analyze_technical_seo(soup)
+        technical_analysis = self._analyze_technical_seo(soup, tags)
         
         # Генерация рекомендаций
         recommendations = self._generate_recommendations(
@@ -86,8 +457,16 @@ class SEOAdvisor:
         # Расчет приоритетов рекомендаций
         prioritized_recommendations = self._prioritize_recommendations(recommendations)
         
-        # Автоматическая генерация улучшенного HTML
-        improved_html = self._auto_improve_html(html, recommendations)
+        # Автоматическая генерация улучшенного HTML, только если есть что
+        # исправлять: анализ дерево не меняет, поэтому свое дерево правится
+        # напрямую, а переданное вызывающим кодом — в копии
+        fixes = self._auto_fixes(recommendations)
+        if not fixes:
+            improved_html = html
+        else:
+            improved_html = self._auto_improve_html(
+                soup if owns_soup else copy.copy(soup), fixes
+            )
         
         return {
             "analysis": {
@@ -98,7 +477,7 @@ class SEOAdvisor:
                 "linking": linking_analysis,
                 "technical": technical_analysis
             },
-            "recommendations": prioritized_recommendations,
+            "recommendations": [rec.to_dict() for rec in prioritized_recommendations],
             "improved_html": improved_html,
             "overall_score": self._calculate_overall_score(
                 basic_analysis, keyword_analysis, readability_analysis,
@@ -107,14 +486,19 @@ class SEOAdvisor:
             "priority_actions": self._get_priority_actions(prioritized_recommendations)
         }
     
-    def _basic_seo_analysis(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _basic_seo_analysis(
+        self, soup: BeautifulSoup, tags: Dict[str, List[Tag]], heading_tags: List[Tag]
+    ) -> Dict[str, Any]:
         """Базовый SEO анализ"""
+        head = self._head_scope(soup)
+        
         # Анализ title
-        title_tag = soup.find("title")
+        title_tag = head.find("title")
+        title_text = title_tag.get_text().strip() if title_tag else ""
         title_analysis = {
             "exists": bool(title_tag),
-            "text": title_tag.get_text().strip() if title_tag else "",
-            "length": len(title_tag.get_text().strip()) if title_tag else 0,
+            "text": title_text,
+            "length": len(title_text),
             "issues": []
         }
         
@@ -126,11 +510,12 @@ class SEOAdvisor:
             title_analysis["issues"].append(f"Title слишком длинный (> {self.IDEAL_TITLE_LENGTH[1]} символов)")
         
         # Анализ meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
+        meta_desc = head.find("meta", attrs={"name": "description"})
+        desc_text = meta_desc.get("content", "").strip() if meta_desc else ""
         desc_analysis = {
             "exists": bool(meta_desc),
-            "text": meta_desc.get("content", "").strip() if meta_desc else "",
-            "length": len(meta_desc.get("content", "").strip()) if meta_desc else 0,
+            "text": desc_text,
+            "length": len(desc_text),
             "issues": []
         }
         
@@ -142,10 +527,10 @@ class SEOAdvisor:
             desc_analysis["issues"].append(f"Meta description слишком длинное (> {self.IDEAL_META_DESC_LENGTH[1]} символов)")
         
         # Анализ заголовков
-        headings_analysis = self._analyze_headings_structure(soup)
+        headings_analysis = self._analyze_headings_structure(heading_tags)
         
         # Анализ изображений
-        images_analysis = self._analyze_images_seo(soup)
+        images_analysis = self._analyze_images_seo(tags["img"])
         
         return {
             "title": title_analysis,
@@ -154,33 +539,48 @@ class SEOAdvisor:
             "images": images_analysis
         }
     
-    def _analyze_keywords(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_text(self, soup: BeautifulSoup) -> Tuple[str, List[str], List[str]]:
+        """Текст страницы без script/style, его слова и предложения"""
+        # get_text() документа не включает содержимое script/style/template,
+        # так что дерево не нужно менять: json-ld и другие скрипты остаются
+        # доступны техническому анализу
+        text = soup.get_text()
+        return text, tokenize_words(text), tokenize_sentences(text)
+    
+    def _analyze_keywords(self, tags: Dict[str, List[Tag]], text: str, words: List[str]) -> Dict[str, Any]:
         """Анализ плотности ключевых слов и их распределения"""
-        # Извлекаем текстовый контент
-        for script in soup(["script", "style"]):
-            script.decompose()
+        # Фильтрация и подсчет за один проход, без промежуточного списка
+        stop_words = self.stop_words
+        word_freq = Counter(
+            word for word in map(str.lower, words) if word.isalpha() and word not in stop_words
+        )
+        total_words = sum(word_freq.values())
+        # Плотность в процентах: одно деление на все ключевые слова
+        density_scale = 100.0 / total_words if total_words > 0 else 0.0
         
-        text = soup.get_text()
-        words = word_tokenize(text.lower())
-        words = [word for word in words if word.isalpha() and word not in self.stop_words]
+        # Title, H1 и meta description не зависят от ключевого слова
+        title_tag = tags["title"][0] if tags["title"] else None
+        title_text = title_tag.get_text().lower() if title_tag else None
+        meta_desc = next((m for m in tags["meta"] if m.get("name") == "description"), None)
+        meta_desc_content = meta_desc.get("content", "").lower() if meta_desc else ""
+        h1_texts = [h1.get_text().lower() for h1 in tags["h1"]]
         
-        total_words = len(words)
-        word_freq = Counter(words)
+        # Все ключевые слова ищутся в тексте за один проход
+        keyword_hits = _scan_keywords(text.lower(), self._keywords_lower)
         
         # Анализ заданных ключевых слов
         keyword_analysis = {}
-        for keyword in self.target_keywords:
-            keyword_lower = keyword.lower()
-            count = text.lower().count(keyword_lower)
-            density = (count / total_words * 100) if total_words > 0 else 0
+        for keyword, keyword_lower in zip(self.target_keywords, self._keywords_lower):
+            count, first_pos = keyword_hits[keyword_lower]
+            density = count * density_scale
             
             keyword_analysis[keyword] = {
                 "count": count,
                 "density": density,
-                "in_title": keyword_lower in soup.find("title").get_text().lower() if soup.find("title") else False,
-                "in_h1": any(keyword_lower in h1.get_text().lower() for h1 in soup.find_all("h1")),
-                "in_meta_desc": keyword_lower in (soup.find("meta", attrs={"name": "description"}).get("content", "").lower() if soup.find("meta", attrs={"name": "description"}) else ""),
-                "first_occurrence": self._find_first_occurrence_position(text, keyword_lower)
+                "in_title": keyword_lower in title_text if title_text is not None else False,
+                "in_h1": any(keyword_lower in h1_text for h1_text in h1_texts),
+                "in_meta_desc": keyword_lower in meta_desc_content,
+                "first_occurrence": self._find_first_occurrence_position(text, first_pos)
             }
         
         # Топ ключевые слова в контенте
@@ -191,33 +591,27 @@ class SEOAdvisor:
             "unique_words": len(word_freq),
             "target_keywords": keyword_analysis,
             "top_keywords": top_keywords,
-            "keyword_stuffing_risk": self._detect_keyword_stuffing(word_freq, total_words)
+            "keyword_stuffing_risk": self._detect_keyword_stuffing(word_freq, density_scale)
         }
     
-    def _analyze_readability(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_readability(
+        self, tags: Dict[str, List[Tag]], text: str, sentences: List[str], words: List[str]
+    ) -> Dict[str, Any]:
         """Анализ читаемости контента"""
-        # Извлекаем основной текстовый контент
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        text = soup.get_text()
-        sentences = sent_tokenize(text)
-        words = word_tokenize(text)
-        
         # Базовые метрики
         total_sentences = len(sentences)
-        total_words = len([word for word in words if word.isalpha()])
+        words = [word for word in words if word.isalpha()]
+        total_words = len(words)
         avg_sentence_length = total_words / total_sentences if total_sentences > 0 else 0
         
         # Анализ длины предложений
-        long_sentences = [s for s in sentences if len(word_tokenize(s)) > self.MAX_SENTENCE_LENGTH]
+        long_sentences = [s for s in sentences if len(tokenize_words(s)) > self.MAX_SENTENCE_LENGTH]
         
         # Показатели читаемости
-        flesch_score = flesch_reading_ease(text) if text else 0
-        fk_grade = flesch_kincaid_grade(text) if text else 0
+        flesch_score, fk_grade = _readability_scores(text)
         
         # Анализ абзацев
-        paragraphs = soup.find_all("p")
+        paragraphs = tags["p"]
         paragraph_analysis = self._analyze_paragraphs(paragraphs)
         
         return {
@@ -230,13 +624,13 @@ class SEOAdvisor:
             "paragraphs": paragraph_analysis
         }
     
-    def _analyze_content_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_content_structure(self, tags: Dict[str, List[Tag]], heading_tags: List[Tag]) -> Dict[str, Any]:
         """Анализ структуры контента"""
         # Анализ заголовков
         headings_hierarchy = []
         current_level = 0
         
-        for heading in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
+        for heading in heading_tags:
             level = int(heading.name[1])
             text = heading.get_text().strip()
             
@@ -244,7 +638,7 @@ class SEOAdvisor:
                 "level": level,
                 "text": text,
                 "length": len(text),
-                "has_keywords": any(kw.lower() in text.lower() for kw in self.target_keywords)
+                "has_keywords": self._contains_keyword(text)
             })
             
             if level > current_level + 1:
@@ -253,20 +647,26 @@ class SEOAdvisor:
             current_level = level
         
         # Анализ списков
-        lists = soup.find_all(["ul", "ol"])
         list_analysis = {
-            "total_lists": len(lists),
-            "unordered_lists": len(soup.find_all("ul")),
-            "ordered_lists": len(soup.find_all("ol")),
-            "total_list_items": len(soup.find_all("li"))
+            "total_lists": len(tags["ul"]) + len(tags["ol"]),
+            "unordered_lists": len(tags["ul"]),
+            "ordered_lists": len(tags["ol"]),
+            "total_list_items": len(tags["li"])
         }
         
         # Анализ таблиц
-        tables = soup.find_all("table")
+        tables = tags["table"]
+        with_headers = with_captions = 0
+        for table in tables:
+            if table.find("th"):
+                with_headers += 1
+            if table.find("caption"):
+                with_captions += 1
+        
         table_analysis = {
             "total_tables": len(tables),
-            "tables_with_headers": len([t for t in tables if t.find("th")]),
-            "tables_with_captions": len([t for t in tables if t.find("caption")])
+            "tables_with_headers": with_headers,
+            "tables_with_captions": with_captions
         }
         
         return {
@@ -276,9 +676,9 @@ class SEOAdvisor:
             "structure_score": self._calculate_structure_score(headings_hierarchy, list_analysis)
         }
     
-    def _analyze_internal_linking(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_internal_linking(self, tags: Dict[str, List[Tag]], page_text: str) -> Dict[str, Any]:
         """Анализ внутренней перелинковки"""
-        links = soup.find_all("a", href=True)
+        links = [link for link in tags["a"] if link.get("href") is not None]
         
         internal_links = []
         external_links = []
@@ -287,12 +687,12 @@ class SEOAdvisor:
             href = link["href"]
             text = link.get_text().strip()
             
-            if href.startswith("http"):
-                parsed = urlparse(href)
+            external = _URL_RE.match(href)
+            if external:
                 external_links.append({
                     "url": href,
                     "text": text,
-                    "domain": parsed.netloc
+                    "domain": external.group(1) or ""
                 })
             else:
                 internal_links.append({
@@ -303,8 +703,7 @@ class SEOAdvisor:
         
         # Анализ якорного текста
         anchor_texts = [link["text"] for link in internal_links if link["text"]]
-        anchor_keyword_usage = sum(1 for text in anchor_texts 
-                                  if any(kw.lower() in text.lower() for kw in self.target_keywords))
+        anchor_keyword_usage = sum(1 for text in anchor_texts if self._contains_keyword(text))
         
         return {
             "total_links": len(links),
@@ -312,47 +711,77 @@ class SEOAdvisor:
             "external_links": len(external_links),
             "anchor_links": len([l for l in internal_links if l["is_anchor"]]),
             "anchor_keyword_usage": anchor_keyword_usage,
-            "link_density": len(links) / len(soup.get_text().split()) if soup.get_text() else 0,
+            "link_density": len(links) / len(page_text.split()) if page_text else 0,
             "internal_link_details": internal_links[:10],  # Первые 10 для анализа
             "external_domains": list(set(link["domain"] for link in external_links))
         }
     
-    def _analyze_technical_seo(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_technical_seo(self, soup: BeautifulSoup, tags: Dict[str, List[Tag]]) -> Dict[str, Any]:
         """Технический SEO анализ"""
-        # Анализ meta тегов
-        meta_tags = soup.find_all("meta")
+        head = self._head_scope(soup)
+        
+        # Анализ meta тегов: один обход, затем разбор атрибутов в цикле
+        meta_tags = tags["meta"]
+        head_meta_tags = meta_tags if head is soup else head.find_all("meta")
+        has_viewport = has_charset = has_robots = False
+        og_tags = twitter_cards = 0
+        for meta in head_meta_tags:
+            name = meta.get("name")
+            if name == "viewport":
+                has_viewport = True
+            elif name == "robots":
+                has_robots = True
+            elif name and _TWITTER_RE.match(name):
+                twitter_cards += 1
+            prop = meta.get("property")
+            if prop and _OG_RE.match(prop):
+                og_tags += 1
+            if meta.get("charset") is not None:
+                has_charset = True
+        
         meta_analysis = {
             "total_meta_tags": len(meta_tags),
-            "has_viewport": bool(soup.find("meta", attrs={"name": "viewport"})),
-            "has_charset": bool(soup.find("meta", attrs={"charset": True})),
-            "has_robots": bool(soup.find("meta", attrs={"name": "robots"})),
-            "has_canonical": bool(soup.find("link", attrs={"rel": "canonical"})),
-            "has_og_tags": len(soup.find_all("meta", attrs={"property": re.compile("^og:")})),
-            "has_twitter_cards": len(soup.find_all("meta", attrs={"name": re.compile("^twitter:")}))
+            "has_viewport": has_viewport,
+            "has_charset": has_charset,
+            "has_robots": has_robots,
+            "has_canonical": bool(head.find("link", attrs={"rel": "canonical"})),
+            "has_og_tags": og_tags,
+            "has_twitter_cards": twitter_cards
         }
         
         # Анализ структурированных данных
-        json_ld_scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
+        json_ld_scripts = [s for s in tags["script"] if s.get("type") == "application/ld+json"]
         structured_data = {
             "json_ld_count": len(json_ld_scripts),
-            "microdata_items": len(soup.find_all(attrs={"itemtype": True})),
+            "microdata_items": sum(
+                1 for named in tags.values() for tag in named if tag.get("itemtype") is not None
+            ),
             "has_schema_org": any("schema.org" in script.get_text() for script in json_ld_scripts)
         }
         
         # Анализ изображений
-        images = soup.find_all("img")
+        images = tags["img"]
+        with_alt = with_title = with_lazy_loading = 0
+        for img in images:
+            if img.get("alt"):
+                with_alt += 1
+            if img.get("title"):
+                with_title += 1
+            if img.get("loading") == "lazy":
+                with_lazy_loading += 1
+        
         image_seo = {
             "total_images": len(images),
-            "images_with_alt": len([img for img in images if img.get("alt")]),
-            "images_with_title": len([img for img in images if img.get("title")]),
-            "images_with_lazy_loading": len([img for img in images if img.get("loading") == "lazy"])
+            "images_with_alt": with_alt,
+            "images_with_title": with_title,
+            "images_with_lazy_loading": with_lazy_loading
         }
         
         return {
             "meta_tags": meta_analysis,
             "structured_data": structured_data,
             "images": image_seo,
-            "has_lang_attribute": bool(soup.find("html", attrs={"lang": True}))
+            "has_lang_attribute": any(html.get("lang") is not None for html in tags["html"])
         }
     
     def _generate_recommendations(
@@ -364,10 +793,11 @@ class SEOAdvisor:
         linking: Dict, 
         technical: Dict,
         target_audience: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Recommendation]:
         """Генерация персонализированных рекомендаций"""
         recommendations = []
         
+        # Разделы без проблем пропускаются без вызова генераторов
         # Рекомендации по title
         if basic["title"]["issues"]:
             recommendations.extend(self._generate_title_recommendations(basic["title"], keywords))
@@ -377,10 +807,12 @@ class SEOAdvisor:
             recommendations.extend(self._generate_meta_desc_recommendations(basic["meta_description"]))
         
         # Рекомендации по заголовкам
-        recommendations.extend(self._generate_heading_recommendations(basic["headings"], structure))
+        if basic["headings"]["issues"]:
+            recommendations.extend(self._generate_heading_recommendations(basic["headings"], structure))
         
         # Рекомендации по ключевым словам
-        recommendations.extend(self._generate_keyword_recommendations(keywords))
+        if keywords["target_keywords"] or keywords["keyword_stuffing_risk"]["risk_level"] == "high":
+            recommendations.extend(self._generate_keyword_recommendations(keywords))
         
         # Рекомендации по читаемости
         recommendations.extend(self._generate_readability_recommendations(readability, target_audience))
@@ -392,97 +824,101 @@ class SEOAdvisor:
         recommendations.extend(self._generate_technical_recommendations(technical))
         
         # Рекомендации по изображениям
-        recommendations.extend(self._generate_image_recommendations(basic["images"]))
+        if basic["images"]["missing_alt"]:
+            recommendations.extend(self._generate_image_recommendations(basic["images"]))
         
         return recommendations
     
-    def _generate_title_recommendations(self, title_analysis: Dict, keywords: Dict) -> List[Dict]:
+    def _generate_title_recommendations(self, title_analysis: Dict, keywords: Dict) -> Iterator[Recommendation]:
         """Генерация рекомендаций по title"""
-        recommendations = []
+        title_text = title_analysis["text"]
+        length = title_analysis["length"]
+        min_length, max_length = self.IDEAL_TITLE_LENGTH
         
         if not title_analysis["exists"]:
-            recommendations.append({
-                "type": "critical",
-                "category": "title",
-                "issue": "Отсутствует тег title",
-                "recommendation": "Добавьте уникальный и описательный тег title",
-                "example": f"<title>Ваш основной заголовок - Название сайта</title>",
-                "impact": "high"
-            })
-        elif title_analysis["length"] < self.IDEAL_TITLE_LENGTH[0]:
-            recommendations.append({
-                "type": "warning",
-                "category": "title",
-                "issue": f"Title слишком короткий ({title_analysis['length']} символов)",
-                "recommendation": f"Расширьте title до {self.IDEAL_TITLE_LENGTH[0]}-{self.IDEAL_TITLE_LENGTH[1]} символов",
-                "example": self._suggest_improved_title(title_analysis["text"], keywords),
-                "impact": "medium"
-            })
-        elif title_analysis["length"] > self.IDEAL_TITLE_LENGTH[1]:
-            recommendations.append({
-                "type": "warning",
-                "category": "title",
-                "issue": f"Title слишком длинный ({title_analysis['length']} символов)",
-                "recommendation": f"Сократите title до {self.IDEAL_TITLE_LENGTH[1]} символов или менее",
-                "example": self._suggest_shortened_title(title_analysis["text"]),
-                "impact": "medium"
-            })
+            yield _REC_TITLE_MISSING
+        elif length < min_length:
+            yield replace(
+                _REC_TITLE_LENGTH,
+                issue=f"Title слишком короткий ({length} символов)",
+                recommendation=_threshold_message(_MSG_TITLE_EXPAND, min_length, max_length),
+                example=self._suggest_improved_title(title_text, keywords)
+            )
+        elif length > max_length:
+            yield replace(
+                _REC_TITLE_LENGTH,
+                issue=f"Title слишком длинный ({length} символов)",
+                recommendation=_threshold_message(_MSG_TITLE_SHORTEN, max_length),
+                example=self._suggest_shortened_title(title_text)
+            )
         
         # Проверка использования ключевых слов в title
-        if self.target_keywords and not any(kw.lower() in title_analysis["text"].lower() for kw in self.target_keywords):
-            recommendations.append({
-                "type": "suggestion",
-                "category": "title",
-                "issue": "Ключевые слова не используются в title",
-                "recommendation": "Включите основное ключевое слово в начало title",
-                "example": f"{self.target_keywords[0]} - {title_analysis['text']}" if self.target_keywords else "",
-                "impact": "medium"
-            })
-        
-        return recommendations
+        if self.target_keywords and not self._contains_keyword(title_text):
+            yield replace(
+                _REC_TITLE_KEYWORDS,
+                example=f"{self.target_keywords[0]} - {title_text}"
+            )
+    
+    @staticmethod
+    def _auto_fixes(recommendations: List[Recommendation]) -> set:
+        """Категории рекомендаций, которые _auto_improve_html исправит в HTML"""
+        fixes = set()
+        for rec in recommendations:
+            category = rec.category
+            # title и meta description добавляются, только если их нет
+            # (critical); предупреждения о длине HTML не меняют
+            if category == "images" or (
+                rec.type == "critical" and category in ("title", "meta_description")
+            ):
+                fixes.add(category)
+        return fixes
     
-    def _auto_improve_html(self, html: str, recommendations: List[Dict]) -> str:
+    def _auto_improve_html(self, soup: BeautifulSoup, fixes: set) -> str:
         """Автоматическое улучшение HTML на основе рекомендаций"""
-        soup = BeautifulSoup(html, "html.parser")
+        if "title" in fixes and not soup.find("title"):
+            # Автоматически добавляем title если его нет
+            head = soup.find("head")
+            if head:
+                title_tag = soup.new_tag("title")
+                title_tag.string = "Новая страница"  # Базовый title
+                head.insert(0, title_tag)
+        
+        if "meta_description" in fixes and not soup.find("meta", attrs={"name": "description"}):
+            # Автоматически добавляем meta description
+            head = soup.find("head")
+            if head:
+                meta_tag = soup.new_tag("meta", attrs={
+                    "name": "description", 
+                    "content": "Описание страницы"
+                })
+                head.append(meta_tag)
         
-        for rec in recommendations:
-            if rec["type"] == "critical" and rec["category"] == "title":
-                # Автоматически добавляем title если его нет
-                if not soup.find("title"):
-                    head = soup.find("head")
-                    if head:
-                        title_tag = soup.new_tag("title")
-                        title_tag.string = "Новая страница"  # Базовый title
-                        head.insert(0, title_tag)
-            
-            elif rec["category"] == "meta_description":
-                # Автоматически добавляем meta description
-                if not soup.find("meta", attrs={"name": "description"}):
-                    head = soup.find("head")
-                    if head:
-                        meta_tag = soup.new_tag("meta", attrs={
-                            "name": "description", 
-                            "content": "Описание страницы"
-                        })
-                        head.append(meta_tag)
-            
-            elif rec["category"] == "images":
-                # Автоматически добавляем alt к изображениям
-                for img in soup.find_all("img"):
-                    if not img.get("alt"):
-                        img["alt"] = "Изображение"
+        if "images" in fixes:
+            # Автоматически добавляем alt к изображениям
+            for img in soup.find_all("img"):
+                if not img.get("alt"):
+                    img["alt"] = "Изображение"
         
         return str(soup)
     
     # Вспомогательные методы
     
-    def _analyze_headings_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Анализ структуры заголовков"""
-        headings = {f"h{i}": [] for i in range(1, 7)}
+    def _contains_keyword(self, text: str) -> bool:
+        """Содержит ли текст хотя бы одно из целевых ключевых слов (без учета регистра)"""
+        text = text.lower()
+        return any(kw in text for kw in self._keywords_lower)
+    
+    @staticmethod
+    def _head_scope(soup: BeautifulSoup):
+        """Поддерево head для поиска метаданных (весь документ, если head нет)"""
+        return soup.head or soup
+    
+    def _analyze_headings_structure(self, heading_tags: List) -> Dict[str, Any]:
+        """Анализ структуры заголовков (heading_tags — все h1-h6 в порядке документа)"""
+        headings = {name: [] for name in _HEADING_TAGS}
         
-        for i in range(1, 7):
-            tags = soup.find_all(f"h{i}")
-            headings[f"h{i}"] = [tag.get_text().strip() for tag in tags]
+        for tag in heading_tags:
+            headings[tag.name].append(tag.get_text().strip())
         
         issues = []
         h1_count = len(headings["h1"])
@@ -503,14 +939,13 @@ class SEOAdvisor:
         return {
             "structure": headings,
             "h1_count": h1_count,
-            "total_headings": sum(len(h) for h in headings.values()),
+            "total_headings": len(heading_tags),
             "issues": issues,
             "keyword_usage": self._check_keyword_usage_in_headings(headings)
         }
     
-    def _analyze_images_seo(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_images_seo(self, images: List[Tag]) -> Dict[str, Any]:
         """Анализ SEO изображений"""
-        images = soup.find_all("img")
         
         total_images = len(images)
         missing_alt = 0
@@ -543,20 +978,20 @@ class SEOAdvisor:
             "issues": issues
         }
     
-    def _find_first_occurrence_position(self, text: str, keyword: str) -> int:
-        """Находит позицию первого вхождения ключевого слова в тексте (в процентах)"""
-        pos = text.lower().find(keyword.lower())
+    def _find_first_occurrence_position(self, text: str, pos: int) -> int:
+        """Переводит позицию первого вхождения ключевого слова в проценты от длины текста"""
         if pos == -1:
             return -1
         return int((pos / len(text)) * 100) if text else -1
     
-    def _detect_keyword_stuffing(self, word_freq: Counter, total_words: int) -> Dict[str, Any]:
-        """Обнаружение переспама ключевых слов"""
+    def _detect_keyword_stuffing(self, word_freq: Counter, density_scale: float) -> Dict[str, Any]:
+        """Обнаружение переспама ключевых слов (density_scale = 100 / число слов)"""
         risk_words = []
+        max_density = self.IDEAL_KEYWORD_DENSITY[1]
         
         for word, count in word_freq.most_common(20):
-            density = (count / total_words * 100) if total_words > 0 else 0
-            if density > self.IDEAL_KEYWORD_DENSITY[1]:
+            density = count * density_scale
+            if density > max_density:
                 risk_words.append({
                     "word": word,
                     "count": count,
@@ -639,7 +1074,7 @@ class SEOAdvisor:
         
         for level, heading_list in headings.items():
             for heading_text in heading_list:
-                if any(kw.lower() in heading_text.lower() for kw in self.target_keywords):
+                if self._contains_keyword(heading_text):
                     usage[level] += 1
         
         return usage
@@ -659,240 +1094,188 @@ class SEOAdvisor:
             return current_title
         return current_title[:self.IDEAL_TITLE_LENGTH[1]-3] + "..."
     
-    def _generate_meta_desc_recommendations(self, meta_desc: Dict) -> List[Dict]:
+    def _generate_meta_desc_recommendations(self, meta_desc: Dict) -> Iterator[Recommendation]:
         """Генерация рекомендаций по meta description"""
-        recommendations = []
+        length = meta_desc["length"]
+        min_length, max_length = self.IDEAL_META_DESC_LENGTH
         
         if not meta_desc["exists"]:
-            recommendations.append({
-                "type": "critical",
-                "category": "meta_description",
-                "issue": "Отсутствует meta description",
-                "recommendation": "Добавьте уникальное и привлекательное описание страницы",
-                "example": '<meta name="description" content="Краткое описание содержимого страницы">',
-                "impact": "high"
-            })
-        elif meta_desc["length"] < self.IDEAL_META_DESC_LENGTH[0]:
-            recommendations.append({
-                "type": "warning",
-                "category": "meta_description",
-                "issue": f"Meta description слишком короткое ({meta_desc['length']} символов)",
-                "recommendation": f"Расширьте до {self.IDEAL_META_DESC_LENGTH[0]}-{self.IDEAL_META_DESC_LENGTH[1]} символов",
-                "impact": "medium"
-            })
-        
-        return recommendations
+            yield _REC_META_DESC_MISSING
+        elif length < min_length:
+            yield replace(
+                _REC_META_DESC_SHORT,
+                issue=f"Meta description слишком короткое ({length} символов)",
+                recommendation=_threshold_message(_MSG_META_DESC_EXPAND, min_length, max_length)
+            )
     
-    def _generate_heading_recommendations(self, headings: Dict, structure: Dict) -> List[Dict]:
+    def _generate_heading_recommendations(self, headings: Dict, structure: Dict) -> Iterator[Recommendation]:
         """Генерация рекомендаций по заголовкам"""
-        recommendations = []
-        
         for issue in headings["issues"]:
             if "Отсутствует H1" in issue:
-                recommendations.append({
-                    "type": "critical",
-                    "category": "headings",
-                    "issue": issue,
-                    "recommendation": "Добавьте единственный H1 заголовок, описывающий основную тему страницы",
-                    "example": "<h1>Основной заголовок страницы</h1>",
-                    "impact": "high"
-                })
+                yield replace(_REC_H1_MISSING, issue=issue)
             elif "H1 заголовков" in issue:
-                recommendations.append({
-                    "type": "warning",
-                    "category": "headings",
-                    "issue": issue,
-                    "recommendation": "Используйте только один H1 заголовок на странице",
-                    "impact": "medium"
-                })
-        
-        return recommendations
+                yield replace(_REC_H1_MULTIPLE, issue=issue)
     
-    def _generate_keyword_recommendations(self, keywords: Dict) -> List[Dict]:
+    def _generate_keyword_recommendations(self, keywords: Dict) -> Iterator[Recommendation]:
         """Генерация рекомендаций по ключевым словам"""
-        recommendations = []
+        min_density, max_density = self.IDEAL_KEYWORD_DENSITY
         
         for keyword, analysis in keywords["target_keywords"].items():
-            if analysis["density"] < self.IDEAL_KEYWORD_DENSITY[0]:
-                recommendations.append({
-                    "type": "suggestion",
-                    "category": "keywords",
-                    "issue": f"Низкая плотность ключевого слова '{keyword}' ({analysis['density']:.1f}%)",
-                    "recommendation": f"Увеличьте использование ключевого слова до {self.IDEAL_KEYWORD_DENSITY[0]}-{self.IDEAL_KEYWORD_DENSITY[1]}%",
-                    "impact": "medium"
-                })
-            elif analysis["density"] > self.IDEAL_KEYWORD_DENSITY[1]:
-                recommendations.append({
-                    "type": "warning",
-                    "category": "keywords",
-                    "issue": f"Переспам ключевого слова '{keyword}' ({analysis['density']:.1f}%)",
-                    "recommendation": f"Снизьте использование ключевого слова до {self.IDEAL_KEYWORD_DENSITY[1]}% или менее",
-                    "impact": "medium"
-                })
+            density = analysis["density"]
+            if density < min_density:
+                yield replace(
+                    _REC_KEYWORD_LOW_DENSITY,
+                    issue=f"Низкая плотность ключевого слова '{keyword}' ({density:.1f}%)",
+                    recommendation=_threshold_message(_MSG_DENSITY_RAISE, min_density, max_density)
+                )
+            elif density > max_density:
+                yield replace(
+                    _REC_KEYWORD_HIGH_DENSITY,
+                    issue=f"Переспам ключевого слова '{keyword}' ({density:.1f}%)",
+                    recommendation=_threshold_message(_MSG_DENSITY_LOWER, max_density)
+                )
         
         if keywords["keyword_stuffing_risk"]["risk_level"] == "high":
-            recommendations.append({
-                "type": "warning",
-                "category": "keywords",
-                "issue": "Высокий риск переспама ключевых слов",
-                "recommendation": "Используйте синонимы и связанные термины для естественного текста",
-                "impact": "high"
-            })
-        
-        return recommendations
+            yield _REC_KEYWORD_STUFFING
     
-    def _generate_readability_recommendations(self, readability: Dict, target_audience: str) -> List[Dict]:
+    def _generate_readability_recommendations(self, readability: Dict, target_audience: str) -> Iterator[Recommendation]:
         """Генерация рекомендаций по читаемости"""
-        recommendations = []
-        
-        target_score = 60 if target_audience == "general" else 50 if target_audience == "professional" else 70
-        
-        if readability["flesch_reading_ease"] < target_score:
-            recommendations.append({
-                "type": "suggestion",
-                "category": "readability",
-                "issue": f"Низкая читаемость ({readability['flesch_reading_ease']:.1f})",
-                "recommendation": "Упростите текст: используйте короткие предложения и простые слова",
-                "impact": "medium"
-            })
-        
-        if readability["avg_sentence_length"] > self.MAX_SENTENCE_LENGTH:
-            recommendations.append({
-                "type": "suggestion",
-                "category": "readability",
-                "issue": f"Слишком длинные предложения (в среднем {readability['avg_sentence_length']:.1f} слов)",
-                "recommendation": f"Сократите предложения до {self.MAX_SENTENCE_LENGTH} слов или менее",
-                "impact": "medium"
-            })
-        
-        return recommendations
+        reading_ease = readability["flesch_reading_ease"]
+        sentence_length = readability["avg_sentence_length"]
+        max_sentence_length = self.MAX_SENTENCE_LENGTH
+        
+        target_score = _TARGET_SCORE.get(target_audience, 70)
+        
+        if reading_ease < target_score:
+            yield replace(
+                _REC_LOW_READABILITY,
+                issue=f"Низкая читаемость ({reading_ease:.1f})"
+            )
+        
+        if sentence_length > max_sentence_length:
+            yield replace(
+                _REC_LONG_SENTENCES,
+                issue=f"Слишком длинные предложения (в среднем {sentence_length:.1f} слов)",
+                recommendation=_threshold_message(_MSG_SENTENCES_SHORTEN, max_sentence_length)
+            )
     
-    def _generate_linking_recommendations(self, linking: Dict) -> List[Dict]:
+    def _generate_linking_recommendations(self, linking: Dict) -> Iterator[Recommendation]:
         """Генерация рекомендаций по внутренней перелинковке"""
-        recommendations = []
+        internal_links = linking["internal_links"]
         
-        if linking["internal_links"] < 3:
-            recommendations.append({
-                "type": "suggestion",
-                "category": "linking",
-                "issue": f"Мало внутренних ссылок ({linking['internal_links']})",
-                "recommendation": "Добавьте 3-5 внутренних ссылок на связанные страницы",
-                "impact": "medium"
-            })
+        if internal_links < 3:
+            yield replace(
+                _REC_FEW_INTERNAL_LINKS,
+                issue=f"Мало внутренних ссылок ({internal_links})"
+            )
         
         if linking["anchor_keyword_usage"] == 0 and self.target_keywords:
-            recommendations.append({
-                "type": "suggestion",
-                "category": "linking",
-                "issue": "Ключевые слова не используются в якорном тексте ссылок",
-                "recommendation": "Используйте ключевые слова в тексте внутренних ссылок",
-                "impact": "low"
-            })
-        
-        return recommendations
+            yield _REC_ANCHOR_KEYWORDS
     
-    def _generate_technical_recommendations(self, technical: Dict) -> List[Dict]:
+    def _generate_technical_recommendations(self, technical: Dict) -> Iterator[Recommendation]:
         """Генерация технических рекомендаций"""
-        recommendations = []
-        
         if not technical["meta_tags"]["has_viewport"]:
-            recommendations.append({
-                "type": "warning",
-                "category": "technical",
-                "issue": "Отсутствует viewport meta тег",
-                "recommendation": "Добавьте viewport meta тег для мобильной адаптации",
-                "example": '<meta name="viewport" content="width=device-width, initial-scale=1.0">',
-                "impact": "high"
-            })
+            yield _REC_VIEWPORT
         
         if not technical["has_lang_attribute"]:
-            recommendations.append({
-                "type": "warning",
-                "category": "technical",
-                "issue": "Отсутствует атрибут lang у тега html",
-                "recommendation": "Добавьте атрибут lang для указания языка страницы",
-                "example": '<html lang="ru">',
-                "impact": "medium"
-            })
+            yield _REC_LANG
         
         if technical["structured_data"]["json_ld_count"] == 0:
-            recommendations.append({
-                "type": "suggestion",
-                "category": "technical",
-                "issue": "Отсутствуют структурированные данные",
-                "recommendation": "Добавьте JSON-LD разметку для лучшего понимания поисковиками",
-                "impact": "medium"
-            })
-        
-        return recommendations
+            yield _REC_STRUCTURED_DATA
     
-    def _generate_image_recommendations(self, images: Dict) -> List[Dict]:
+    def _generate_image_recommendations(self, images: Dict) -> Iterator[Recommendation]:
         """Генерация рекомендаций по изображениям"""
-        recommendations = []
-        
-        if images["missing_alt"] > 0:
-            recommendations.append({
-                "type": "warning",
-                "category": "images",
-                "issue": f"{images['missing_alt']} изображений без alt атрибута",
-                "recommendation": "Добавьте описательные alt атрибуты ко всем изображениям",
-                "example": '<img src="image.jpg" alt="Описание изображения">',
-                "impact": "medium"
-            })
+        missing_alt = images["missing_alt"]
         
-        return recommendations
+        if missing_alt > 0:
+            yield replace(
+                _REC_IMAGES_ALT,
+                issue=f"{missing_alt} изображений без alt атрибута"
+            )
     
-    def _prioritize_recommendations(self, recommendations: List[Dict]) -> List[Dict]:
+    def _prioritize_recommendations(self, recommendations: List[Recommendation]) -> List[Recommendation]:
         """Приоритизация рекомендаций"""
-        priority_order = {"critical": 0, "warning": 1, "suggestion": 2}
-        impact_order = {"high": 0, "medium": 1, "low": 2}
-        
-        return sorted(recommendations, key=lambda x: (
-            priority_order.get(x["type"], 3),
-            impact_order.get(x["impact"], 3)
-        ))
+        return sorted(recommendations, key=_rec_order)
     
     def _calculate_overall_score(self, basic: Dict, keywords: Dict, readability: Dict, structure: Dict, technical: Dict) -> int:
         """Расчет общей SEO оценки"""
-        score = 100
-        
-        # Базовые элементы (30 баллов)
-        if basic["title"]["issues"]:
-            score -= 15
-        if basic["meta_description"]["issues"]:
-            score -= 15
-        
-        # Заголовки (15 баллов)
-        if basic["headings"]["issues"]:
-            score -= 15
-        
-        # Ключевые слова (20 баллов)
-        if keywords["keyword_stuffing_risk"]["risk_level"] == "high":
-            score -= 20
-        elif keywords["keyword_stuffing_risk"]["risk_level"] == "medium":
-            score -= 10
-        
-        # Читаемость (15 баллов)
-        if readability["flesch_reading_ease"] < 60:
-            score -= 15
-        
-        # Технические аспекты (10 баллов)
-        if not technical["meta_tags"]["has_viewport"]:
-            score -= 5
-        if not technical["has_lang_attribute"]:
-            score -= 5
-        
-        # Изображения (10 баллов)
-        if basic["images"]["missing_alt"] > 0:
-            score -= 10
+        risk_level = keywords["keyword_stuffing_risk"]["risk_level"]
+        
+        score = (
+            100
+            # Базовые элементы (30 баллов)
+            - 15 * bool(basic["title"]["issues"])
+            - 15 * bool(basic["meta_description"]["issues"])
+            # Заголовки (15 баллов)
+            - 15 * bool(basic["headings"]["issues"])
+            # Ключевые слова (20 баллов)
+            - _STUFFING_PENALTY.get(risk_level, 0)
+            # Читаемость (15 баллов)
+            - 15 * (readability["flesch_reading_ease"] < 60)
+            # Технические аспекты (10 баллов)
+            - 5 * (not technical["meta_tags"]["has_viewport"])
+            - 5 * (not technical["has_lang_attribute"])
+            # Изображения (10 баллов)
+            - 10 * (basic["images"]["missing_alt"] > 0)
+        )
         
         return max(0, score)
     
-    def _get_priority_actions(self, recommendations: List[Dict]) -> List[str]:
-        """Получение приоритетных действий"""
-        critical_actions = [rec["recommendation"] for rec in recommendations 
-                           if rec["type"] == "critical"]
-        high_impact_actions = [rec["recommendation"] for rec in recommendations 
-                              if rec["impact"] == "high" and rec["type"] != "critical"]
+    def _calculate_overall_score_batch(self, pages: List[Dict]) -> List[int]:
+        """
+        Общие SEO оценки для набора страниц (аудит сайта).
+        pages — словари "analysis" из результатов analyze_and_recommend
+        """
+        if not numpy_available or len(pages) < 32:
+            return [
+                self._calculate_overall_score(
+                    page["basic"], page["keywords"], page["readability"],
+                    page["structure"], page["technical"]
+                )
+                for page in pages
+            ]
+        
+        count = len(pages)
+        basics = [page["basic"] for page in pages]
+        technicals = [page["technical"] for page in pages]
+        
+        def flags(values):
+            return np.fromiter(values, dtype=np.int32, count=count)
+        
+        # Та же арифметика, что и в _calculate_overall_score, но над массивами
+        scores = (
+            100
+            - 15 * flags(bool(basic["title"]["issues"]) for basic in basics)
+            - 15 * flags(bool(basic["meta_description"]["issues"]) for basic in basics)
+            - 15 * flags(bool(basic["headings"]["issues"]) for basic in basics)
+            - flags(
+                _STUFFING_PENALTY.get(page["keywords"]["keyword_stuffing_risk"]["risk_level"], 0)
+                for page in pages
+            )
+            - 15 * flags(page["readability"]["flesch_reading_ease"] < 60 for page in pages)
+            - 5 * flags(not technical["meta_tags"]["has_viewport"] for technical in technicals)
+            - 5 * flags(not technical["has_lang_attribute"] for technical in technicals)
+            - 10 * flags(basic["images"]["missing_alt"] > 0 for basic in basics)
+        )
+        np.maximum(scores, 0, out=scores)
+        
+        return scores.tolist()
+    
+    def _get_priority_actions(self, recommendations: List[Recommendation]) -> List[str]:
+        """
+        Получение приоритетных действий. Порядок входного списка не важен:
+        критические упорядочиваются, а из прочих high-impact берутся 3 первых
+        по приоритету без сортировки всего списка
+        """
+        critical = []
+        high_impact = []
+        for rec in recommendations:
+            if rec.type == "critical":
+                critical.append(rec)
+            elif rec.impact == "high":
+                high_impact.append(rec)
+        
+        critical.sort(key=_rec_order)
+        top_high_impact = heapq.nsmallest(3, high_impact, key=_rec_order)  # Максимум 3 дополнительных действия
         
-        return critical_actions + high_impact_actions[:3]  # Максимум 3 дополнительных действия
+        return [rec.recommendation for rec in critical] + [rec.recommendation for rec in top_high_impact]
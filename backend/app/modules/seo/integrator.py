@@ -1,11 +1,80 @@
-import re
 import json
+import os
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+from bs4.element import Script
 
-from app.modules.seo.advisor import SEOAdvisor
+from app.modules.seo.advisor import HTML_PARSER, SEOAdvisor, _index_tags
 from app.modules.seo.service import SEOService
 
+try:
+    import orjson
+
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+# Разделители в имени файла изображения, заменяемые пробелами в alt
+_ALT_TRANSLATE = str.maketrans({"_": " ", "-": " "})
+
+
+def _dump_json_ld(data: Dict[str, Any], indent: bool = False) -> str:
+    """JSON-LD для script тега; orjson, если установлен, в разы быстрее json"""
+    if orjson_available:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None)
+
+
+# Интегратор процесса-исполнителя batch_integrate; создается один раз на процесс,
+# чтобы кэш анализа советника переиспользовался между заданиями
+_worker_integrator: Optional["SEOIntegrator"] = None
+
+
+def _init_batch_worker() -> None:
+    global _worker_integrator
+    _worker_integrator = SEOIntegrator()
+
+
+def _integrate_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Одно задание batch_integrate: аргументы integrate_seo_recommendations"""
+    return _worker_integrator.integrate_seo_recommendations(**job)
+
+
+@dataclass(slots=True)
+class _PageIndex:
+    """
+    Теги страницы, найденные одним обходом дерева. Заменяет find и find_all
+    в шагах интеграции; шаги, добавляющие теги, которые ищутся на следующих
+    шагах, дописывают их в индекс. changed отмечает, что дерево изменено
+    """
+
+    tags: Dict[str, List[Tag]]
+    headings: List[Tag]
+    head: Optional[Tag]
+    body: Optional[Tag]
+    changed: bool = False
+
+    @classmethod
+    def build(cls, soup: BeautifulSoup) -> "_PageIndex":
+        tags, headings = _index_tags(soup)
+        return cls(tags, headings, soup.head, soup.body)
+
+    def ensure_head(self, soup: BeautifulSoup) -> Tag:
+        """head документа; создается, если его нет"""
+        if self.head is None:
+            head = soup.new_tag("head")
+            html_tag = soup.html
+            if html_tag is not None:
+                html_tag.insert(0, head)
+            else:
+                soup.insert(0, head)
+            self.head = head
+            self.changed = True
+        return self.head
+
 
 class SEOIntegrator:
     """
@@ -44,6 +113,16 @@ class SEOIntegrator:
                 "density_target": 1.5  # %
             }
         }
+        
+        # Автоисправления по категориям рекомендаций:
+        # (раздел auto_fix_config с флагом auto_fix или None, метод, текст отчета)
+        self._fix_dispatch = {
+            "title": ("title", self._fix_title, "Исправлен title"),
+            "meta_description": ("meta_description", self._fix_meta_description, "Исправлен meta description"),
+            "headings": ("headings", self._fix_headings, "Исправлена структура заголовков"),
+            "images": ("images", self._fix_images, "Исправлены изображения"),
+            "technical": (None, self._fix_technical_issues, "Исправлена техническая проблема")
+        }
     
     def integrate_seo_recommendations(
         self, 
@@ -73,30 +152,45 @@ class SEOIntegrator:
             target_audience=target_audience
         )
         
+        # HTML разбирается один раз: исправления и оптимизации вносятся
+        # в одно дерево, которое затем переиспользуется для валидации
+        soup = BeautifulSoup(html, HTML_PARSER)
+        
+        # Индекс тегов строится одним обходом на весь вызов
+        page = _PageIndex.build(soup)
+        
         # Применение автоматических исправлений
         if auto_apply:
-            optimized_html = self._apply_auto_fixes(
-                html, 
+            soup = self._apply_auto_fixes(
+                soup, 
+                page,
                 seo_analysis["recommendations"], 
                 content_context
             )
-        else:
-            optimized_html = html
         
         # Генерация дополнительных SEO улучшений
-        enhanced_html = self._apply_enhanced_optimizations(
-            optimized_html,
+        soup = self._apply_enhanced_optimizations(
+            soup,
+            page,
             seo_analysis,
             content_context,
             target_keywords
         )
         
-        # Валидация результата
-        final_analysis = self.advisor.analyze_and_recommend(
-            html=enhanced_html,
-            target_keywords=target_keywords,
-            target_audience=target_audience
-        )
+        if page.changed:
+            enhanced_html = str(soup)
+            
+            # Валидация результата
+            final_analysis = self.advisor.analyze_and_recommend(
+                html=enhanced_html,
+                target_keywords=target_keywords,
+                target_audience=target_audience,
+                soup=soup
+            )
+        else:
+            # Страница не изменилась: повторный анализ дал бы тот же результат
+            enhanced_html = html
+            final_analysis = seo_analysis
         
         # Генерация отчета об изменениях
         changes_report = self._generate_changes_report(
@@ -118,63 +212,71 @@ class SEOIntegrator:
             )
         }
     
+    @classmethod
+    def batch_integrate(
+        cls,
+        jobs: List[Dict[str, Any]],
+        workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Интеграция SEO рекомендаций для пакета страниц в пуле процессов
+        
+        Каждое задание — словарь аргументов integrate_seo_recommendations
+        (html, content_context, target_keywords, ...). Разбор и анализ
+        упираются в CPU, поэтому потоки под GIL не ускоряют пакет, а процессы
+        масштабируются по ядрам. Результаты возвращаются в порядке заданий
+        """
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        if workers <= 1:
+            integrator = cls()
+            return [integrator.integrate_seo_recommendations(**job) for job in jobs]
+        
+        # Задания отправляются пачками, чтобы не платить за IPC на каждую страницу
+        chunksize = max(1, len(jobs) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as executor:
+            return list(executor.map(_integrate_job, jobs, chunksize=chunksize))
+    
     def _apply_auto_fixes(
         self, 
-        html: str, 
+        soup: BeautifulSoup, 
+        page: _PageIndex,
         recommendations: List[Dict],
         content_context: Optional[Dict[str, Any]] = None
-    ) -> str:
+    ) -> BeautifulSoup:
         """Применение автоматических исправлений"""
-        soup = BeautifulSoup(html, "html.parser")
         applied_fixes = []
         
         for rec in recommendations:
             if rec["type"] == "critical" or (
                 rec["type"] == "warning" and rec["impact"] == "high"
             ):
-                if rec["category"] == "title" and self.auto_fix_config["title"]["auto_fix"]:
-                    soup = self._fix_title(soup, rec, content_context)
-                    applied_fixes.append(f"Исправлен title: {rec['issue']}")
-                
-                elif rec["category"] == "meta_description" and self.auto_fix_config["meta_description"]["auto_fix"]:
-                    soup = self._fix_meta_description(soup, rec, content_context)
-                    applied_fixes.append(f"Исправлен meta description: {rec['issue']}")
-                
-                elif rec["category"] == "headings" and self.auto_fix_config["headings"]["auto_fix"]:
-                    soup = self._fix_headings(soup, rec, content_context)
-                    applied_fixes.append(f"Исправлена структура заголовков: {rec['issue']}")
-                
-                elif rec["category"] == "images" and self.auto_fix_config["images"]["auto_fix"]:
-                    soup = self._fix_images(soup, rec)
-                    applied_fixes.append(f"Исправлены изображения: {rec['issue']}")
-                
-                elif rec["category"] == "technical":
-                    soup = self._fix_technical_issues(soup, rec)
-                    applied_fixes.append(f"Исправлена техническая проблема: {rec['issue']}")
+                fix = self._fix_dispatch.get(rec["category"])
+                if fix is None:
+                    continue
+                config_section, handler, label = fix
+                if config_section is None or self.auto_fix_config[config_section]["auto_fix"]:
+                    soup = handler(soup, page, rec, content_context)
+                    applied_fixes.append(f"{label}: {rec['issue']}")
+                    page.changed = True
         
-        return str(soup)
+        return soup
     
     def _fix_title(
         self, 
         soup: BeautifulSoup, 
+        page: _PageIndex,
         recommendation: Dict,
         content_context: Optional[Dict[str, Any]] = None
     ) -> BeautifulSoup:
         """Автоматическое исправление title"""
-        head = soup.find("head")
-        if not head:
-            head = soup.new_tag("head")
-            if soup.find("html"):
-                soup.find("html").insert(0, head)
-            else:
-                soup.insert(0, head)
-        
-        title_tag = soup.find("title")
+        titles = page.tags["title"]
+        title_tag = titles[0] if titles else None
         
         if not title_tag:
             # Создаем новый title
             title_tag = soup.new_tag("title")
-            head.insert(0, title_tag)
+            page.ensure_head(soup).insert(0, title_tag)
+            titles.append(title_tag)
         
         # Генерируем улучшенный title
         new_title = self._generate_improved_title(
@@ -189,23 +291,18 @@ class SEOIntegrator:
     def _fix_meta_description(
         self, 
         soup: BeautifulSoup, 
+        page: _PageIndex,
         recommendation: Dict,
         content_context: Optional[Dict[str, Any]] = None
     ) -> BeautifulSoup:
         """Автоматическое исправление meta description"""
-        head = soup.find("head")
-        if not head:
-            head = soup.new_tag("head")
-            if soup.find("html"):
-                soup.find("html").insert(0, head)
-            else:
-                soup.insert(0, head)
-        
-        meta_desc = soup.find("meta", attrs={"name": "description"})
+        metas = page.tags["meta"]
+        meta_desc = next((meta for meta in metas if meta.get("name") == "description"), None)
         
         if not meta_desc:
             meta_desc = soup.new_tag("meta", attrs={"name": "description"})
-            head.append(meta_desc)
+            page.ensure_head(soup).append(meta_desc)
+            metas.append(meta_desc)
         
         # Генерируем улучшенное описание
         new_description = self._generate_improved_description(
@@ -220,6 +317,7 @@ class SEOIntegrator:
     def _fix_headings(
         self, 
         soup: BeautifulSoup, 
+        page: _PageIndex,
         recommendation: Dict,
         content_context: Optional[Dict[str, Any]] = None
     ) -> BeautifulSoup:
@@ -231,27 +329,37 @@ class SEOIntegrator:
             h1_tag.string = h1_text
             
             # Ищем место для вставки H1
-            body = soup.find("body")
-            if body:
+            if page.body is not None:
                 # Вставляем в начало body
-                body.insert(0, h1_tag)
+                page.body.insert(0, h1_tag)
             else:
                 # Добавляем в начало документа
                 soup.insert(0, h1_tag)
+            page.tags["h1"].insert(0, h1_tag)
+            page.headings.insert(0, h1_tag)
         
         elif "Multiple H1" in recommendation["issue"]:
             # Преобразуем дополнительные H1 в H2
-            h1_tags = soup.find_all("h1")
+            h1_tags = page.tags["h1"]
+            headings = page.headings
             for i, h1 in enumerate(h1_tags[1:], 1):  # Оставляем первый H1
                 h2_tag = soup.new_tag("h2")
                 h2_tag.string = h1.get_text()
                 h1.replace_with(h2_tag)
+                headings[headings.index(h1)] = h2_tag
+            del h1_tags[1:]
         
         return soup
     
-    def _fix_images(self, soup: BeautifulSoup, recommendation: Dict) -> BeautifulSoup:
+    def _fix_images(
+        self, 
+        soup: BeautifulSoup, 
+        page: _PageIndex,
+        recommendation: Dict,
+        content_context: Optional[Dict[str, Any]] = None
+    ) -> BeautifulSoup:
         """Автоматическое исправление изображений"""
-        images = soup.find_all("img")
+        images = page.tags["img"]
         
         for img in images:
             if not img.get("alt"):
@@ -265,67 +373,76 @@ class SEOIntegrator:
         
         return soup
     
-    def _fix_technical_issues(self, soup: BeautifulSoup, recommendation: Dict) -> BeautifulSoup:
+    def _fix_technical_issues(
+        self, 
+        soup: BeautifulSoup, 
+        page: _PageIndex,
+        recommendation: Dict,
+        content_context: Optional[Dict[str, Any]] = None
+    ) -> BeautifulSoup:
         """Исправление технических SEO проблем"""
-        head = soup.find("head")
-        if not head:
-            head = soup.new_tag("head")
-            if soup.find("html"):
-                soup.find("html").insert(0, head)
-            else:
-                soup.insert(0, head)
+        # head создается, даже если исправлять нечего, как и раньше
+        head = page.ensure_head(soup)
+        metas = page.tags["meta"]
+        issue = recommendation["issue"].lower()
         
-        if "viewport" in recommendation["issue"].lower():
-            if not soup.find("meta", attrs={"name": "viewport"}):
+        if "viewport" in issue:
+            if not any(meta.get("name") == "viewport" for meta in metas):
                 viewport_tag = soup.new_tag("meta", attrs={
                     "name": "viewport",
                     "content": "width=device-width, initial-scale=1.0"
                 })
                 head.append(viewport_tag)
+                metas.append(viewport_tag)
         
-        if "lang" in recommendation["issue"].lower():
-            html_tag = soup.find("html")
-            if html_tag and not html_tag.get("lang"):
+        if "lang" in issue:
+            html_tag = soup.html
+            if html_tag is not None and not html_tag.get("lang"):
                 html_tag["lang"] = "ru"
         
-        if "charset" in recommendation["issue"].lower():
-            if not soup.find("meta", attrs={"charset": True}):
+        if "charset" in issue:
+            if not any(meta.has_attr("charset") for meta in metas):
                 charset_tag = soup.new_tag("meta", attrs={"charset": "UTF-8"})
                 head.insert(0, charset_tag)
+                metas.append(charset_tag)
         
         return soup
     
     def _apply_enhanced_optimizations(
         self,
-        html: str,
+        soup: BeautifulSoup,
+        page: _PageIndex,
         seo_analysis: Dict,
         content_context: Optional[Dict[str, Any]] = None,
         target_keywords: Optional[List[str]] = None
-    ) -> str:
+    ) -> BeautifulSoup:
         """Применение дополнительных SEO оптимизаций"""
-        soup = BeautifulSoup(html, "html.parser")
+        # Без контекста и ключевых слов ни одна оптимизация ничего не добавляет
+        if not content_context and not target_keywords:
+            return soup
         
         # Добавление структурированных данных
-        soup = self._add_structured_data(soup, content_context)
+        soup = self._add_structured_data(soup, page, content_context)
         
         # Оптимизация внутренней перелинковки
-        soup = self._optimize_internal_linking(soup, content_context)
+        soup = self._optimize_internal_linking(soup, page, content_context)
         
         # Добавление Open Graph тегов
-        soup = self._add_open_graph_tags(soup, content_context)
+        soup = self._add_open_graph_tags(soup, page, content_context)
         
         # Оптимизация заголовков для ключевых слов
         if target_keywords:
-            soup = self._optimize_headings_for_keywords(soup, target_keywords)
+            soup = self._optimize_headings_for_keywords(soup, page, target_keywords)
         
         # Добавление хлебных крошек
-        soup = self._add_breadcrumbs(soup, content_context)
+        soup = self._add_breadcrumbs(soup, page, content_context)
         
-        return str(soup)
+        return soup
     
     def _add_structured_data(
         self, 
         soup: BeautifulSoup, 
+        page: _PageIndex,
         content_context: Optional[Dict[str, Any]] = None
     ) -> BeautifulSoup:
         """Добавление структурированных данных"""
@@ -362,22 +479,28 @@ class SEOIntegrator:
         
         # Создаем script тег с JSON-LD
         script_tag = soup.new_tag("script", attrs={"type": "application/ld+json"})
-        script_tag.string = json.dumps(structured_data, ensure_ascii=False, indent=2)
+        # Script, как и при разборе, чтобы текст JSON-LD не попадал в get_text()
+        script_tag.string = soup.new_string(_dump_json_ld(structured_data, indent=True), Script)
         
-        head = soup.find("head")
-        if head:
-            head.append(script_tag)
+        if page.head is not None:
+            page.head.append(script_tag)
+            page.changed = True
         
         return soup
     
     def _optimize_internal_linking(
         self, 
         soup: BeautifulSoup, 
+        page: _PageIndex,
         content_context: Optional[Dict[str, Any]] = None
     ) -> BeautifulSoup:
         """Оптимизация внутренней перелинковки"""
+        # Предложения ссылок строятся только по категории контента
+        if not content_context or not content_context.get("category"):
+            return soup
+        
         # Находим все ссылки
-        links = soup.find_all("a", href=True)
+        links = [link for link in page.tags["a"] if link.has_attr("href")]
         internal_links = [link for link in links if not link["href"].startswith("http")]
         
         if len(internal_links) < self.auto_fix_config["internal_linking"]["min_links"]:
@@ -402,23 +525,23 @@ class SEOIntegrator:
                 related_section.append(links_list)
                 
                 # Вставляем в конец body
-                body = soup.find("body")
-                if body:
-                    body.append(related_section)
+                if page.body is not None:
+                    page.body.append(related_section)
+                    page.changed = True
+                    # Заголовок блока — последний в документе
+                    page.headings.append(related_title)
         
         return soup
     
     def _add_open_graph_tags(
         self, 
         soup: BeautifulSoup, 
+        page: _PageIndex,
         content_context: Optional[Dict[str, Any]] = None
     ) -> BeautifulSoup:
         """Добавление Open Graph тегов"""
-        if not content_context:
-            return soup
-        
-        head = soup.find("head")
-        if not head:
+        head = page.head
+        if not content_context or head is None:
             return soup
         
         og_tags = [
@@ -430,55 +553,74 @@ class SEOIntegrator:
             ("og:site_name", content_context.get("site_name", ""))
         ]
         
+        existing_properties = {meta.get("property") for meta in page.tags["meta"]}
+        
         for property_name, content in og_tags:
-            if content and not soup.find("meta", attrs={"property": property_name}):
+            if content and property_name not in existing_properties:
                 og_tag = soup.new_tag("meta", attrs={
                     "property": property_name,
                     "content": content
                 })
                 head.append(og_tag)
+                page.changed = True
         
         return soup
     
     def _optimize_headings_for_keywords(
         self, 
         soup: BeautifulSoup, 
+        page: _PageIndex,
         target_keywords: List[str]
     ) -> BeautifulSoup:
         """Оптимизация заголовков для ключевых слов"""
-        headings = soup.find_all(["h2", "h3", "h4", "h5", "h6"])
+        subheadings = [heading for heading in page.headings if heading.name != "h1"]
+        keywords_lower = [kw.lower() for kw in target_keywords]
         
-        for i, heading in enumerate(headings):
+        # Ключевое слово i добавляется только в i-й подзаголовок,
+        # поэтому остальные заголовки не проверяются
+        for i, heading in enumerate(subheadings[:len(target_keywords)]):
             text = heading.get_text().strip()
+            text_lower = text.lower()
             
             # Если заголовок не содержит ключевых слов, предлагаем улучшение
-            if not any(kw.lower() in text.lower() for kw in target_keywords):
-                if i < len(target_keywords):
-                    # Добавляем ключевое слово в заголовок
-                    improved_text = f"{target_keywords[i]}: {text}"
-                    heading.string = improved_text
+            if not any(kw in text_lower for kw in keywords_lower):
+                # Добавляем ключевое слово в заголовок
+                improved_text = f"{target_keywords[i]}: {text}"
+                heading.string = improved_text
+                page.changed = True
         
         return soup
     
     def _add_breadcrumbs(
         self, 
         soup: BeautifulSoup, 
+        page: _PageIndex,
         content_context: Optional[Dict[str, Any]] = None
     ) -> BeautifulSoup:
         """Добавление хлебных крошек"""
-        if not content_context or not content_context.get("breadcrumbs"):
+        # Без body хлебные крошки некуда вставить
+        if not content_context or not content_context.get("breadcrumbs") or page.body is None:
             return soup
         
         breadcrumbs_data = content_context["breadcrumbs"]
+        last_index = len(breadcrumbs_data) - 1
         
-        # HTML структура хлебных крошек
+        # HTML структура хлебных крошек и элементы JSON-LD за один проход
         nav = soup.new_tag("nav", attrs={"aria-label": "breadcrumb"})
         ol = soup.new_tag("ol", attrs={"class": "breadcrumb"})
+        item_list = []
         
         for i, crumb in enumerate(breadcrumbs_data):
+            item_list.append({
+                "@type": "ListItem",
+                "position": i + 1,
+                "name": crumb["title"],
+                "item": crumb["url"]
+            })
+            
             li = soup.new_tag("li", attrs={"class": "breadcrumb-item"})
             
-            if i == len(breadcrumbs_data) - 1:  # Последний элемент
+            if i == last_index:  # Последний элемент
                 li["class"] = "breadcrumb-item active"
                 li["aria-current"] = "page"
                 li.string = crumb["title"]
@@ -495,29 +637,19 @@ class SEOIntegrator:
         breadcrumb_ld = {
             "@context": "https://schema.org",
             "@type": "BreadcrumbList",
-            "itemListElement": [
-                {
-                    "@type": "ListItem",
-                    "position": i + 1,
-                    "name": crumb["title"],
-                    "item": crumb["url"]
-                }
-                for i, crumb in enumerate(breadcrumbs_data)
-            ]
+            "itemListElement": item_list
         }
         
         script_tag = soup.new_tag("script", attrs={"type": "application/ld+json"})
-        script_tag.string = json.dumps(breadcrumb_ld, ensure_ascii=False)
+        script_tag.string = soup.new_string(_dump_json_ld(breadcrumb_ld), Script)
         
         # Вставляем хлебные крошки в начало body
-        body = soup.find("body")
-        if body:
-            body.insert(0, nav)
-            
-            # Добавляем JSON-LD в head
-            head = soup.find("head")
-            if head:
-                head.append(script_tag)
+        page.body.insert(0, nav)
+        page.changed = True
+        
+        # Добавляем JSON-LD в head
+        if page.head is not None:
+            page.head.append(script_tag)
         
         return soup
     
@@ -595,7 +727,7 @@ class SEOIntegrator:
         if src:
             filename = src.split("/")[-1].split(".")[0]
             # Заменяем символы на пробелы и делаем читаемым
-            alt_text = re.sub(r"[_-]", " ", filename).title()
+            alt_text = filename.translate(_ALT_TRANSLATE).title()
             return alt_text
         
         return self.auto_fix_config["images"]["default_alt"]
@@ -646,12 +778,12 @@ class SEOIntegrator:
             improvements.append(f"SEO балл увеличен на {score_improvement} пунктов")
         
         # Анализируем конкретные улучшения
-        original_critical = [r for r in original_analysis["recommendations"] 
-                           if r["type"] == "critical"]
-        final_critical = [r for r in final_analysis["recommendations"] 
-                        if r["type"] == "critical"]
+        original_critical = sum(1 for r in original_analysis["recommendations"]
+                                if r["type"] == "critical")
+        final_critical = sum(1 for r in final_analysis["recommendations"]
+                             if r["type"] == "critical")
         
-        critical_fixed = len(original_critical) - len(final_critical)
+        critical_fixed = original_critical - final_critical
         if critical_fixed > 0:
             improvements.append(f"Исправлено {critical_fixed} критических проблем")
         
@@ -690,30 +822,26 @@ class SEOIntegrator:
             target_keywords=target_keywords
         )
         
-        # Группируем рекомендации по категориям
-        recommendations_by_category = {}
+        # Группируем рекомендации по категориям и считаем типы за один проход
+        recommendations_by_category = defaultdict(list)
+        type_counts = Counter()
         for rec in analysis["recommendations"]:
-            category = rec["category"]
-            if category not in recommendations_by_category:
-                recommendations_by_category[category] = []
-            recommendations_by_category[category].append(rec)
+            recommendations_by_category[rec["category"]].append(rec)
+            type_counts[rec["type"]] += 1
         
         # Создаем сводку
         summary = {
             "overall_score": analysis["overall_score"],
             "total_recommendations": len(analysis["recommendations"]),
-            "critical_issues": len([r for r in analysis["recommendations"] 
-                                  if r["type"] == "critical"]),
-            "warnings": len([r for r in analysis["recommendations"] 
-                           if r["type"] == "warning"]),
-            "suggestions": len([r for r in analysis["recommendations"] 
-                              if r["type"] == "suggestion"]),
+            "critical_issues": type_counts["critical"],
+            "warnings": type_counts["warning"],
+            "suggestions": type_counts["suggestion"],
             "top_priorities": analysis["priority_actions"]
         }
         
         return {
             "summary": summary,
             "detailed_analysis": analysis["analysis"],
-            "recommendations_by_category": recommendations_by_category,
+            "recommendations_by_category": dict(recommendations_by_category),
             "actionable_items": analysis["priority_actions"]
         }
@@ -1,256 +1,388 @@
+import os
 import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from html import escape
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    selectolax_available = True
+except ImportError:
+    selectolax_available = False
+
+# Префиксы свойств, которые собирает анализатор
+_OG_PREFIXES = ("og:", "article:")
+
+# Шаблоны проверки свойств компилируются один раз при импорте модуля
+_URL_RE = re.compile(r"^https?://[^\s]+$")
+# Один шаблон URL изображения для свойства og:image и анализа изображений
+_IMAGE_URL_RE = re.compile(r"^https?://[^\s]+\.(?:jpg|jpeg|png|gif|webp)$", re.IGNORECASE)
+_LOCALE_RE = re.compile(r"^[a-z]{2}_[A-Z]{2}$")
+
+
+def _is_iso_datetime(value: str) -> bool:
+    """
+    Дата/время в формате ISO 8601 (с Z, смещением, долями секунды);
+    datetime.fromisoformat реализован в C и точнее регулярного выражения
+    """
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+@dataclass(frozen=True, slots=True)
+class _PropertySpec:
+    """
+    Правила проверки одного OG свойства, собранные из его конфигурации;
+    отсутствующее ограничение длины — 0, остальные отсутствующие правила — None
+    """
+
+    prop: str
+    min_length: int = 0
+    max_length: int = 0
+    # Проверка формата: match регулярного выражения или функция-валидатор
+    format_check: Optional[Callable[[str], Any]] = None
+    allowed_values: Optional[FrozenSet[str]] = None
+    min_value: Optional[int] = None
+    # Допустимые значения для текста проблемы, в порядке конфигурации
+    allowed_values_text: str = ""
+
+    @classmethod
+    def from_config(cls, prop: str, config: Dict[str, Any]) -> "_PropertySpec":
+        allowed_values = config.get("allowed_values")
+        regex = config.get("regex")
+        return cls(
+            prop,
+            config.get("min_length", 0),
+            config.get("max_length", 0),
+            regex.match if regex is not None else config.get("validator"),
+            frozenset(allowed_values) if allowed_values is not None else None,
+            config.get("min_value"),
+            ", ".join(allowed_values) if allowed_values is not None else "",
+        )
+
+    def validate(self, content: str) -> List[str]:
+        """Проблемы непустого значения свойства; пустой список — значение верно"""
+        prop = self.prop
+        issues = []
+        
+        # Проверяем длину
+        length = len(content)
+        if self.min_length and length < self.min_length:
+            issues.append(
+                f"{prop} слишком короткое ({length} символов, "
+                f"минимум {self.min_length})"
+            )
+        
+        if self.max_length and length > self.max_length:
+            issues.append(
+                f"{prop} слишком длинное ({length} символов, "
+                f"максимум {self.max_length})"
+            )
+        
+        # Проверяем паттерн
+        if self.format_check is not None and not self.format_check(content):
+            issues.append(f"{prop} не соответствует формату")
+        
+        # Проверяем допустимые значения
+        if self.allowed_values is not None and content not in self.allowed_values:
+            issues.append(f"{prop} должно быть одним из: {self.allowed_values_text}")
+        
+        # Проверяем минимальные значения
+        if self.min_value is not None:
+            try:
+                value = int(content)
+                if value < self.min_value:
+                    issues.append(
+                        f"{prop} слишком маленькое ({value}, "
+                        f"минимум {self.min_value})"
+                    )
+            except ValueError:
+                issues.append(f"{prop} должно быть числом")
+        
+        return issues
+
+
+@dataclass(slots=True)
+class _PropertiesAnalysis:
+    """Результаты проверки свойств по группам, все их проблемы и счетчики для оценки"""
+
+    required: Dict[str, Any] = field(default_factory=dict)
+    recommended: Dict[str, Any] = field(default_factory=dict)
+    article: Dict[str, Any] = field(default_factory=dict)
+    issues: List[str] = field(default_factory=list)
+    missing_required: int = 0
+    invalid_required: int = 0
+    existing_recommended: int = 0
+
+
+def _property_analysis(content: str, issues: List[str]) -> Dict[str, Any]:
+    return {
+        "exists": bool(content),
+        "content": content,
+        "valid": not issues,
+        "issues": issues
+    }
+
+
+def _build_specs(properties: Mapping[str, Dict[str, Any]]) -> Tuple[_PropertySpec, ...]:
+    return tuple(_PropertySpec.from_config(prop, config) for prop, config in properties.items())
+
+
+def _extract_og_tags(html: str) -> List[Tuple[str, str]]:
+    """
+    Пары (property, content) всех OG метатегов (og:* и article:*) в порядке
+    документа. selectolax, если установлен, выбирает их CSS селектором в C
+    без построения дерева BeautifulSoup
+    """
+    if selectolax_available:
+        tree = LexborHTMLParser(html)
+        return [
+            (node.attributes["property"], node.attributes.get("content") or "")
+            for node in tree.css('meta[property^="og:"], meta[property^="article:"]')
+        ]
+    
+    # Префикс проверяется startswith, а не регулярным выражением
+    soup = BeautifulSoup(html, "html.parser")
+    og_tags = []
+    for tag in soup.find_all("meta"):
+        property_name = tag.get("property")
+        if property_name and property_name.startswith(_OG_PREFIXES):
+            og_tags.append((property_name, tag.get("content", "")))
+    return og_tags
+
+
+# Обязательные Open Graph свойства
+_REQUIRED_OG_PROPERTIES = MappingProxyType({
+    "og:title": {
+        "min_length": 30,
+        "max_length": 60,
+        "description": "Заголовок для социальных сетей"
+    },
+    "og:description": {
+        "min_length": 120,
+        "max_length": 300,
+        "description": "Описание для социальных сетей"
+    },
+    "og:type": {
+        "allowed_values": ("website", "article", "book", "profile", "music", "video"),
+        "description": "Тип контента"
+    },
+    "og:url": {
+        "regex": _URL_RE,
+        "description": "Канонический URL страницы"
+    },
+    "og:image": {
+        "regex": _IMAGE_URL_RE,
+        "min_width": 1200,
+        "min_height": 630,
+        "description": "Изображение для превью"
+    }
+})
+
+# Рекомендуемые Open Graph свойства
+_RECOMMENDED_OG_PROPERTIES = MappingProxyType({
+    "og:site_name": {
+        "max_length": 40,
+        "description": "Название сайта"
+    },
+    "og:locale": {
+        "regex": _LOCALE_RE,
+        "description": "Локаль контента"
+    },
+    "og:image:alt": {
+        "max_length": 100,
+        "description": "Alt текст для изображения"
+    },
+    "og:image:width": {
+        "min_value": 1200,
+        "description": "Ширина изображения"
+    },
+    "og:image:height": {
+        "min_value": 630,
+        "description": "Высота изображения"
+    }
+})
+
+# Дополнительные свойства для статей
+_ARTICLE_PROPERTIES = MappingProxyType({
+    "article:author": {"description": "Автор статьи"},
+    "article:published_time": {
+        "validator": _is_iso_datetime,
+        "description": "Дата публикации"
+    },
+    "article:modified_time": {
+        "validator": _is_iso_datetime,
+        "description": "Дата изменения"
+    },
+    "article:section": {"description": "Раздел/категория статьи"},
+    "article:tag": {"description": "Теги статьи"}
+})
+
+# Правила проверки в виде плоских спецификаций, чтобы циклы анализа
+# не искали каждое правило в словаре конфигурации
+_REQUIRED_SPECS = _build_specs(_REQUIRED_OG_PROPERTIES)
+_RECOMMENDED_SPECS = _build_specs(_RECOMMENDED_OG_PROPERTIES)
+_ARTICLE_SPECS = _build_specs(_ARTICLE_PROPERTIES)
+
+# Примеры тегов для рекомендаций
+_OG_EXAMPLES = MappingProxyType({
+    "og:title": '<meta property="og:title" content="Заголовок страницы">',
+    "og:description": '<meta property="og:description" content="Описание страницы для социальных сетей">',
+    "og:type": '<meta property="og:type" content="website">',
+    "og:url": '<meta property="og:url" content="https://example.com/page">',
+    "og:image": '<meta property="og:image" content="https://example.com/image.jpg">',
+    "og:site_name": '<meta property="og:site_name" content="Название сайта">',
+    "og:locale": '<meta property="og:locale" content="ru_RU">',
+    "og:image:alt": '<meta property="og:image:alt" content="Описание изображения">',
+    "og:image:width": '<meta property="og:image:width" content="1200">',
+    "og:image:height": '<meta property="og:image:height" content="630">',
+})
+
+# Поля данных контента и свойства генерируемых тегов, в порядке вывода
+_OG_MAIN_TAG_FIELDS = (("title", "og:title"), ("description", "og:description"))
+_OG_IMAGE_TAG_FIELDS = (
+    ("image_alt", "og:image:alt"),
+    ("image_width", "og:image:width"),
+    ("image_height", "og:image:height"),
+)
+_OG_SITE_TAG_FIELDS = (("site_name", "og:site_name"), ("locale", "og:locale"))
+_ARTICLE_TAG_FIELDS = (
+    ("author", "article:author"),
+    ("published_time", "article:published_time"),
+    ("modified_time", "article:modified_time"),
+    ("section", "article:section"),
+)
+
+
+def _og_meta_tag(property_name: str, content: Any) -> str:
+    """meta тег свойства; значение экранируется для атрибута content"""
+    return f'<meta property="{property_name}" content="{escape(str(content))}">'
+
 
 class OpenGraphAnalyzer:
     """
     Анализатор Open Graph метатегов для социальных сетей
     """
     
-    def __init__(self):
-        # Обязательные Open Graph свойства
-        self.required_og_properties = {
-            "og:title": {
-                "min_length": 30,
-                "max_length": 60,
-                "description": "Заголовок для социальных сетей"
-            },
-            "og:description": {
-                "min_length": 120,
-                "max_length": 300,
-                "description": "Описание для социальных сетей"
-            },
-            "og:type": {
-                "allowed_values": ["website", "article", "book", "profile", "music", "video"],
-                "description": "Тип контента"
-            },
-            "og:url": {
-                "pattern": r"^https?://[^\s]+$",
-                "description": "Канонический URL страницы"
-            },
-            "og:image": {
-                "pattern": r"^https?://[^\s]+\.(jpg|jpeg|png|gif|webp)$",
-                "min_width": 1200,
-                "min_height": 630,
-                "description": "Изображение для превью"
-            }
-        }
-        
-        # Рекомендуемые Open Graph свойства
-        self.recommended_og_properties = {
-            "og:site_name": {
-                "max_length": 40,
-                "description": "Название сайта"
-            },
-            "og:locale": {
-                "pattern": r"^[a-z]{2}_[A-Z]{2}$",
-                "description": "Локаль контента"
-            },
-            "og:image:alt": {
-                "max_length": 100,
-                "description": "Alt текст для изображения"
-            },
-            "og:image:width": {
-                "min_value": 1200,
-                "description": "Ширина изображения"
-            },
-            "og:image:height": {
-                "min_value": 630,
-                "description": "Высота изображения"
-            }
-        }
-        
-        # Дополнительные свойства для статей
-        self.article_properties = {
-            "article:author": {"description": "Автор статьи"},
-            "article:published_time": {
-                "pattern": r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z?$",
-                "description": "Дата публикации"
-            },
-            "article:modified_time": {
-                "pattern": r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z?$",
-                "description": "Дата изменения"
-            },
-            "article:section": {"description": "Раздел/категория статьи"},
-            "article:tag": {"description": "Теги статьи"}
-        }
+    # Конфигурация свойств — константы модуля, общие для всех экземпляров,
+    # поэтому создание анализатора на каждый запрос ничего не стоит
+    required_og_properties = _REQUIRED_OG_PROPERTIES
+    recommended_og_properties = _RECOMMENDED_OG_PROPERTIES
+    article_properties = _ARTICLE_PROPERTIES
     
     def analyze_open_graph(self, html: str) -> Dict[str, Any]:
         """
         Полный анализ Open Graph метатегов
         """
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # Находим все OG теги
-        og_tags = soup.find_all("meta", attrs={"property": re.compile("^og:")})
-        og_data = {}
-        
-        for tag in og_tags:
-            property_name = tag.get("property")
-            content = tag.get("content", "")
-            og_data[property_name] = content
+        # Находим все OG теги; при повторе свойства действует последний тег
+        og_tags = _extract_og_tags(html)
+        og_data = dict(og_tags)
         
-        # Анализируем обязательные свойства
-        required_analysis = self._analyze_required_properties(og_data)
-        
-        # Анализируем рекомендуемые свойства
-        recommended_analysis = self._analyze_recommended_properties(og_data)
-        
-        # Анализируем специфичные для статей свойства
-        article_analysis = self._analyze_article_properties(og_data)
+        # Анализируем обязательные, рекомендуемые и статейные свойства
+        properties = self._analyze_properties(og_data)
         
         # Проверяем изображения
         image_analysis = self._analyze_og_images(og_data)
         
         # Генерируем рекомендации
         recommendations = self._generate_og_recommendations(
-            required_analysis, recommended_analysis, article_analysis, image_analysis
+            properties.required, properties.recommended, properties.article, image_analysis
         )
         
         # Рассчитываем оценку
-        score = self._calculate_og_score(
-            required_analysis, recommended_analysis, article_analysis, image_analysis
-        )
+        score = self._calculate_og_score(properties, image_analysis)
+        
+        # Проблемы свойств собраны при проверке, в конце — проблемы изображения
+        issues = properties.issues
+        issues.extend(image_analysis["issues"])
         
         return {
             "og_tags_found": og_data,
-            "required_properties": required_analysis,
-            "recommended_properties": recommended_analysis,
-            "article_properties": article_analysis,
+            "required_properties": properties.required,
+            "recommended_properties": properties.recommended,
+            "article_properties": properties.article,
             "image_analysis": image_analysis,
             "recommendations": recommendations,
             "score": score,
             "total_tags": len(og_tags),
-            "issues": self._collect_issues(
-                required_analysis, recommended_analysis, article_analysis, image_analysis
-            )
+            "issues": issues
         }
     
-    def _analyze_required_properties(self, og_data: Dict[str, str]) -> Dict[str, Any]:
-        """Анализ обязательных Open Graph свойств"""
-        analysis = {}
-        
-        for prop, config in self.required_og_properties.items():
-            content = og_data.get(prop, "")
-            prop_analysis = {
-                "exists": bool(content),
-                "content": content,
-                "valid": True,
-                "issues": []
-            }
-            
-            if not content:
-                prop_analysis["valid"] = False
-                prop_analysis["issues"].append(f"Отсутствует обязательное свойство {prop}")
-            else:
-                # Проверяем длину
-                if "min_length" in config and len(content) < config["min_length"]:
-                    prop_analysis["valid"] = False
-                    prop_analysis["issues"].append(
-                        f"{prop} слишком короткое ({len(content)} символов, "
-                        f"минимум {config['min_length']})"
-                    )
-                
-                if "max_length" in config and len(content) > config["max_length"]:
-                    prop_analysis["valid"] = False
-                    prop_analysis["issues"].append(
-                        f"{prop} слишком длинное ({len(content)} символов, "
-                        f"максимум {config['max_length']})"
-                    )
-                
-                # Проверяем паттерн
-                if "pattern" in config and not re.match(config["pattern"], content):
-                    prop_analysis["valid"] = False
-                    prop_analysis["issues"].append(f"{prop} не соответствует формату")
-                
-                # Проверяем допустимые значения
-                if "allowed_values" in config and content not in config["allowed_values"]:
-                    prop_analysis["valid"] = False
-                    prop_analysis["issues"].append(
-                        f"{prop} должно быть одним из: {', '.join(config['allowed_values'])}"
-                    )
-            
-            analysis[prop] = prop_analysis
-        
-        return analysis
-    
-    def _analyze_recommended_properties(self, og_data: Dict[str, str]) -> Dict[str, Any]:
-        """Анализ рекомендуемых Open Graph свойств"""
-        analysis = {}
-        
-        for prop, config in self.recommended_og_properties.items():
-            content = og_data.get(prop, "")
-            prop_analysis = {
-                "exists": bool(content),
-                "content": content,
-                "valid": True,
-                "issues": []
-            }
-            
-            if content:
-                # Проверяем длину
-                if "max_length" in config and len(content) > config["max_length"]:
-                    prop_analysis["valid"] = False
-                    prop_analysis["issues"].append(
-                        f"{prop} слишком длинное ({len(content)} символов, "
-                        f"максимум {config['max_length']})"
-                    )
-                
-                # Проверяем паттерн
-                if "pattern" in config and not re.match(config["pattern"], content):
-                    prop_analysis["valid"] = False
-                    prop_analysis["issues"].append(f"{prop} не соответствует формату")
-                
-                # Проверяем минимальные значения
-                if "min_value" in config:
-                    try:
-                        value = int(content)
-                        if value < config["min_value"]:
-                            prop_analysis["valid"] = False
-                            prop_analysis["issues"].append(
-                                f"{prop} слишком маленькое ({value}, "
-                                f"минимум {config['min_value']})"
-                            )
-                    except ValueError:
-                        prop_analysis["valid"] = False
-                        prop_analysis["issues"].append(f"{prop} должно быть числом")
-            
-            analysis[prop] = prop_analysis
+    def analyze_open_graph_many(
+        self, htmls: List[str], workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Анализ Open Graph для набора страниц (аудит сайта, краулер);
+        результаты в порядке страниц. selectolax разбирает HTML без GIL,
+        поэтому страницы обрабатываются в пуле потоков; без selectolax
+        разбор держит GIL, и страницы анализируются последовательно
+        """
+        workers = min(workers or os.cpu_count() or 1, len(htmls)) if selectolax_available else 1
+        if workers <= 1:
+            return [self.analyze_open_graph(html) for html in htmls]
         
-        return analysis
+        # Анализатор не хранит состояния, поэтому один экземпляр общий для потоков
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.analyze_open_graph, htmls))
     
-    def _analyze_article_properties(self, og_data: Dict[str, str]) -> Dict[str, Any]:
-        """Анализ свойств для статей"""
-        analysis = {}
-        og_type = og_data.get("og:type", "")
-        
-        # Проверяем только если тип контента - article
-        if og_type == "article":
-            for prop, config in self.article_properties.items():
-                content = og_data.get(prop, "")
-                prop_analysis = {
-                    "exists": bool(content),
-                    "content": content,
-                    "valid": True,
-                    "issues": []
-                }
-                
-                if content and "pattern" in config:
-                    if not re.match(config["pattern"], content):
-                        prop_analysis["valid"] = False
-                        prop_analysis["issues"].append(f"{prop} не соответствует формату")
-                
-                analysis[prop] = prop_analysis
+    def _analyze_properties(self, og_data: Dict[str, str]) -> _PropertiesAnalysis:
+        """
+        Анализ Open Graph свойств одним проходом: вместе с результатами по
+        каждому свойству собираются все проблемы и счетчики для оценки
+        """
+        result = _PropertiesAnalysis()
+        issues = result.issues
+        get = og_data.get
         
-        return analysis
+        # Обязательные свойства
+        for spec in _REQUIRED_SPECS:
+            content = get(spec.prop) or ""
+            if content:
+                prop_issues = spec.validate(content)
+                if prop_issues:
+                    result.invalid_required += 1
+            else:
+                prop_issues = [f"Отсутствует обязательное свойство {spec.prop}"]
+                result.missing_required += 1
+            result.required[spec.prop] = _property_analysis(content, prop_issues)
+            issues.extend(prop_issues)
+        
+        # Рекомендуемые свойства
+        for spec in _RECOMMENDED_SPECS:
+            content = get(spec.prop) or ""
+            if content:
+                prop_issues = spec.validate(content)
+                result.existing_recommended += 1
+            else:
+                prop_issues = []
+            result.recommended[spec.prop] = _property_analysis(content, prop_issues)
+            issues.extend(prop_issues)
+        
+        # Свойства статей проверяем только если тип контента - article
+        if og_data.get("og:type", "") == "article":
+            for spec in _ARTICLE_SPECS:
+                content = get(spec.prop) or ""
+                prop_issues = spec.validate(content) if content else []
+                result.article[spec.prop] = _property_analysis(content, prop_issues)
+                issues.extend(prop_issues)
+        
+        return result
     
     def _analyze_og_images(self, og_data: Dict[str, str]) -> Dict[str, Any]:
         """Анализ Open Graph изображений"""
-        image_url = og_data.get("og:image", "")
-        image_alt = og_data.get("og:image:alt", "")
-        image_width = og_data.get("og:image:width", "")
-        image_height = og_data.get("og:image:height", "")
+        get = og_data.get
+        image_url = get("og:image", "")
+        image_alt = get("og:image:alt", "")
+        image_width = get("og:image:width", "")
+        image_height = get("og:image:height", "")
         
         analysis = {
             "has_image": bool(image_url),
@@ -263,7 +395,7 @@ class OpenGraphAnalyzer:
         
         if image_url:
             # Проверяем URL изображения
-            if re.match(r"^https?://[^\s]+\.(jpg|jpeg|png|gif|webp)$", image_url, re.IGNORECASE):
+            if _IMAGE_URL_RE.match(image_url):
                 analysis["valid_url"] = True
             else:
                 analysis["issues"].append("Неверный формат URL изображения")
@@ -349,142 +481,75 @@ class OpenGraphAnalyzer:
                 "property": "og:image",
                 "issue": "Отсутствует изображение для Open Graph",
                 "recommendation": "Добавьте привлекательное изображение размером минимум 1200x630px",
-                "example": '<meta property="og:image" content="https://example.com/image.jpg">',
+                "example": _OG_EXAMPLES["og:image"],
                 "impact": "high"
             })
         
         return recommendations
     
-    def _get_property_example(self, property_name: str) -> str:
+    @staticmethod
+    def _get_property_example(property_name: str) -> str:
         """Получение примера для свойства"""
-        examples = {
-            "og:title": '<meta property="og:title" content="Заголовок страницы">',
-            "og:description": '<meta property="og:description" content="Описание страницы для социальных сетей">',
-            "og:type": '<meta property="og:type" content="website">',
-            "og:url": '<meta property="og:url" content="https://example.com/page">',
-            "og:image": '<meta property="og:image" content="https://example.com/image.jpg">',
-            "og:site_name": '<meta property="og:site_name" content="Название сайта">',
-            "og:locale": '<meta property="og:locale" content="ru_RU">',
-            "og:image:alt": '<meta property="og:image:alt" content="Описание изображения">',
-            "og:image:width": '<meta property="og:image:width" content="1200">',
-            "og:image:height": '<meta property="og:image:height" content="630">',
-        }
-        
-        return examples.get(property_name, f'<meta property="{property_name}" content="...">')
+        return _OG_EXAMPLES.get(property_name, f'<meta property="{property_name}" content="...">')
     
-    def _calculate_og_score(
-        self, 
-        required: Dict, 
-        recommended: Dict, 
-        article: Dict,
-        image: Dict
-    ) -> int:
+    def _calculate_og_score(self, properties: _PropertiesAnalysis, image: Dict) -> int:
         """Расчет оценки Open Graph"""
-        score = 100
-        
-        # Штрафы за отсутствующие обязательные свойства
-        for prop, analysis in required.items():
-            if not analysis["exists"]:
-                score -= 20
-            elif not analysis["valid"]:
-                score -= 10
-        
-        # Штрафы за проблемы с изображением
-        if not image["has_image"]:
-            score -= 15
-        elif not image["valid_url"]:
-            score -= 10
-        elif not image["valid_dimensions"]:
-            score -= 5
-        
-        # Бонусы за рекомендуемые свойства
-        existing_recommended = sum(1 for analysis in recommended.values() if analysis["exists"])
-        score += min(10, existing_recommended * 2)
+        has_image = image["has_image"]
+        valid_url = image["valid_url"]
+        
+        score = (
+            100
+            # Штрафы за отсутствующие и неверные обязательные свойства
+            - 20 * properties.missing_required
+            - 10 * properties.invalid_required
+            # Штрафы за проблемы с изображением (учитывается первая из них)
+            - 15 * (not has_image)
+            - 10 * (has_image and not valid_url)
+            - 5 * (has_image and valid_url and not image["valid_dimensions"])
+            # Бонусы за рекомендуемые свойства
+            + min(10, properties.existing_recommended * 2)
+        )
         
         return max(0, min(100, score))
     
-    def _collect_issues(
-        self, 
-        required: Dict, 
-        recommended: Dict, 
-        article: Dict,
-        image: Dict
-    ) -> List[str]:
-        """Сбор всех найденных проблем"""
-        issues = []
-        
-        # Проблемы с обязательными свойствами
-        for analysis in required.values():
-            issues.extend(analysis["issues"])
-        
-        # Проблемы с рекомендуемыми свойствами
-        for analysis in recommended.values():
-            issues.extend(analysis["issues"])
-        
-        # Проблемы со статьями
-        for analysis in article.values():
-            issues.extend(analysis["issues"])
-        
-        # Проблемы с изображениями
-        issues.extend(image["issues"])
-        
-        return issues
-    
     def generate_og_tags(self, content_data: Dict[str, Any]) -> List[str]:
         """
         Генерация Open Graph тегов на основе данных контента
         """
+        get = content_data.get
         tags = []
         
         # Обязательные теги
-        if content_data.get("title"):
-            tags.append(f'<meta property="og:title" content="{content_data["title"]}">')
+        for key, property_name in _OG_MAIN_TAG_FIELDS:
+            if get(key):
+                tags.append(_og_meta_tag(property_name, get(key)))
         
-        if content_data.get("description"):
-            tags.append(f'<meta property="og:description" content="{content_data["description"]}">')
+        og_type = get("type", "website")
+        tags.append(_og_meta_tag("og:type", og_type))
         
-        og_type = content_data.get("type", "website")
-        tags.append(f'<meta property="og:type" content="{og_type}">')
+        if get("url"):
+            tags.append(_og_meta_tag("og:url", get("url")))
         
-        if content_data.get("url"):
-            tags.append(f'<meta property="og:url" content="{content_data["url"]}">')
-        
-        if content_data.get("image"):
-            tags.append(f'<meta property="og:image" content="{content_data["image"]}">')
+        if get("image"):
+            tags.append(_og_meta_tag("og:image", get("image")))
             
             # Дополнительные теги для изображения
-            if content_data.get("image_alt"):
-                tags.append(f'<meta property="og:image:alt" content="{content_data["image_alt"]}">')
-            
-            if content_data.get("image_width"):
-                tags.append(f'<meta property="og:image:width" content="{content_data["image_width"]}">')
-            
-            if content_data.get("image_height"):
-                tags.append(f'<meta property="og:image:height" content="{content_data["image_height"]}">')
+            for key, property_name in _OG_IMAGE_TAG_FIELDS:
+                if get(key):
+                    tags.append(_og_meta_tag(property_name, get(key)))
         
         # Рекомендуемые теги
-        if content_data.get("site_name"):
-            tags.append(f'<meta property="og:site_name" content="{content_data["site_name"]}">')
-        
-        if content_data.get("locale"):
-            tags.append(f'<meta property="og:locale" content="{content_data["locale"]}">')
+        for key, property_name in _OG_SITE_TAG_FIELDS:
+            if get(key):
+                tags.append(_og_meta_tag(property_name, get(key)))
         
         # Теги для статей
         if og_type == "article":
-            if content_data.get("author"):
-                tags.append(f'<meta property="article:author" content="{content_data["author"]}">')
-            
-            if content_data.get("published_time"):
-                tags.append(f'<meta property="article:published_time" content="{content_data["published_time"]}">')
-            
-            if content_data.get("modified_time"):
-                tags.append(f'<meta property="article:modified_time" content="{content_data["modified_time"]}">')
-            
-            if content_data.get("section"):
-                tags.append(f'<meta property="article:section" content="{content_data["section"]}">')
+            for key, property_name in _ARTICLE_TAG_FIELDS:
+                if get(key):
+                    tags.append(_og_meta_tag(property_name, get(key)))
             
-            if content_data.get("tags"):
-                for tag in content_data["tags"]:
-                    tags.append(f'<meta property="article:tag" content="{tag}">')
+            for tag in get("tags") or ():
+                tags.append(_og_meta_tag("article:tag", tag))
         
         return tags
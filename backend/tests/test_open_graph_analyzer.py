@@ -0,0 +1,136 @@
+import pytest
+
+from app.modules.seo import open_graph_analyzer
+from app.modules.seo.open_graph_analyzer import OpenGraphAnalyzer
+
+ARTICLE_PAGE = """<html><head>
+<meta property="og:title" content="Open Graph article title for tests">
+<meta property="og:description" content="An article page used to check Open Graph analysis of article properties.">
+<meta property="og:type" content="article">
+<meta property="og:url" content="https://example.com/article">
+<meta property="og:image" content="https://example.com/Cover.JPG">
+<meta property="og:image:width" content="1200">
+<meta property="og:image:height" content="630">
+<meta property="article:author" content="Jane Doe">
+<meta property="article:published_time" content="2024-05-01T10:30:00+00:00">
+<meta property="article:modified_time" content="yesterday">
+<meta property="article:section" content="Guides">
+<meta name="description" content="not an Open Graph tag">
+<meta property="twitter:title" content="not an Open Graph tag either">
+</head><body><p>Body</p></body></html>"""
+
+WEBSITE_PAGE = """<html><head>
+<meta property="og:title" content="Website">
+<meta property="og:type" content="website">
+<meta property="og:image" content="https://example.com/logo.bmp">
+<meta property="article:author" content="Ignored for websites">
+</head></html>"""
+
+PAGES = [
+    ARTICLE_PAGE,
+    WEBSITE_PAGE,
+    "<html><head></head><body>No Open Graph</body></html>",
+    '<meta property="og:title" content="Fragment &amp; entity"><meta property="og:title">',
+    "",
+]
+
+
+@pytest.fixture(params=["selectolax", "bs4"])
+def backend(request, monkeypatch):
+    """Run a test against the selectolax and the BeautifulSoup extraction"""
+    if request.param == "selectolax":
+        if not open_graph_analyzer.selectolax_available:
+            pytest.skip("selectolax is not installed")
+    else:
+        monkeypatch.setattr(open_graph_analyzer, "selectolax_available", False)
+    return request.param
+
+
+class TestOpenGraphAnalysis:
+    """Test Open Graph extraction and validation on both parser paths"""
+
+    def test_article_properties_are_extracted(self, backend):
+        """article:* tags are found and validated for og:type article"""
+        result = OpenGraphAnalyzer().analyze_open_graph(ARTICLE_PAGE)
+
+        assert result["og_tags_found"]["article:author"] == "Jane Doe"
+        assert result["total_tags"] == 11
+        article = result["article_properties"]
+        assert article["article:author"]["content"] == "Jane Doe"
+        assert article["article:published_time"]["valid"] is True
+        assert article["article:modified_time"]["valid"] is False
+        assert article["article:section"]["content"] == "Guides"
+
+    def test_article_properties_only_for_articles(self, backend):
+        """article:* tags are collected but not analysed for other types"""
+        result = OpenGraphAnalyzer().analyze_open_graph(WEBSITE_PAGE)
+        assert result["og_tags_found"]["article:author"] == "Ignored for websites"
+        assert result["article_properties"] == {}
+
+    @pytest.mark.parametrize(
+        "url, valid",
+        [
+            ("https://example.com/Cover.JPG", True),
+            ("https://example.com/image.Png", True),
+            ("http://example.com/a.webp", True),
+            ("https://example.com/logo.bmp", False),
+            ("https://example.com/image.jpg?size=large", False),
+        ],
+    )
+    def test_image_url_extension_is_case_insensitive(self, backend, url, valid):
+        """Image URLs are validated regardless of extension case"""
+        html = f'<meta property="og:image" content="{url}">'
+        image = OpenGraphAnalyzer().analyze_open_graph(html)["image_analysis"]
+        assert image["valid_url"] is valid
+        assert ("Неверный формат URL изображения" in image["issues"]) is not valid
+
+    def test_generated_tags_round_trip(self, backend):
+        """Escaped generate_og_tags output parses back to the original values"""
+        content_data = {
+            "title": 'Tom & "Jerry" <live>',
+            "description": "It's <b>bold</b> & fast",
+            "type": "article",
+            "url": "https://example.com/?a=1&b=2",
+            "image": "https://example.com/cover.png",
+            "author": "O'Brien & Co",
+            "tags": ["a&b", '"quoted"'],
+        }
+        tags = OpenGraphAnalyzer().generate_og_tags(content_data)
+        found = OpenGraphAnalyzer().analyze_open_graph("".join(tags))["og_tags_found"]
+
+        assert found["og:title"] == content_data["title"]
+        assert found["og:description"] == content_data["description"]
+        assert found["og:url"] == content_data["url"]
+        assert found["article:author"] == content_data["author"]
+
+    def test_analyze_many_matches_single(self, backend):
+        """Batch results equal single-page results, in page order"""
+        analyzer = OpenGraphAnalyzer()
+        expected = [analyzer.analyze_open_graph(html) for html in PAGES]
+        for workers in (None, 1, 4):
+            assert analyzer.analyze_open_graph_many(PAGES, workers=workers) == expected
+        assert analyzer.analyze_open_graph_many([]) == []
+
+
+def test_generate_og_tags_escapes_values():
+    """Attribute values are HTML-escaped"""
+    tags = OpenGraphAnalyzer().generate_og_tags(
+        {"title": 'Tom & "Jerry" <live>', "type": "website"}
+    )
+    assert tags == [
+        '<meta property="og:title" content="Tom &amp; &quot;Jerry&quot; &lt;live&gt;">',
+        '<meta property="og:type" content="website">',
+    ]
+
+
+@pytest.mark.skipif(
+    not open_graph_analyzer.selectolax_available,
+    reason="selectolax is not installed",
+)
+def test_parser_paths_agree(monkeypatch):
+    """selectolax and BeautifulSoup extraction give identical analyses"""
+    analyzer = OpenGraphAnalyzer()
+    with_selectolax = analyzer.analyze_open_graph_many(PAGES)
+
+    monkeypatch.setattr(open_graph_analyzer, "selectolax_available", False)
+    assert analyzer.analyze_open_graph_many(PAGES) == with_selectolax
@@ -0,0 +1,286 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from app.modules.plugins.manager import (
+    AnalyticsPlugin,
+    PluginInterface,
+    PluginManager,
+    PluginShortCircuit,
+    SEOPlugin,
+    SocialMetaPlugin,
+    scandir_rs_available,
+)
+
+
+@pytest.fixture
+def plugins_dir(tmp_path):
+    """Plugins directory with regular, hidden, symlinked and invalid entries"""
+    for name in ("a", ".hidden"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "__init__.py").write_text("")
+    (tmp_path / "no_init").mkdir()
+    (tmp_path / "a" / "nested").mkdir()
+    (tmp_path / "a" / "nested" / "__init__.py").write_text("")
+    (tmp_path / "stray.py").write_text("")
+
+    target = tmp_path.parent / f"{tmp_path.name}_linked_target"
+    target.mkdir()
+    (target / "__init__.py").write_text("")
+    os.symlink(target, tmp_path / "linked")
+    return tmp_path
+
+
+class TestPluginDiscovery:
+    """Test plugin directory scanning"""
+
+    @pytest.mark.parametrize("use_rust", [False, True])
+    def test_scan_follows_symlinks(self, plugins_dir, use_rust):
+        """Symlinked plugin packages are discovered like regular ones"""
+        if use_rust and not scandir_rs_available:
+            pytest.skip("scandir-rs is not installed")
+        manager = PluginManager(str(plugins_dir), use_rust=use_rust)
+        assert manager.use_rust == use_rust
+        assert sorted(manager.discover_plugins()) == [".hidden", "a", "linked"]
+
+    @pytest.mark.skipif(not scandir_rs_available, reason="scandir-rs is not installed")
+    def test_scanners_agree(self, plugins_dir):
+        """scandir-rs and os.scandir discovery return the same plugins"""
+        manager = PluginManager(str(plugins_dir))
+        assert sorted(manager._scan_plugins_dir_rust()) == sorted(
+            manager._scan_plugins_dir()
+        )
+
+    def test_discovery_cache_sees_new_init_file(self, plugins_dir, monkeypatch):
+        """Adding __init__.py to an existing directory invalidates the cache"""
+        _age_tree(plugins_dir)
+        manager = PluginManager(str(plugins_dir), use_rust=False)
+        scans = _count_scans(manager, monkeypatch)
+
+        assert sorted(manager.discover_plugins()) == [".hidden", "a", "linked"]
+        assert sorted(manager.discover_plugins()) == [".hidden", "a", "linked"]
+        assert scans == [1]
+
+        (plugins_dir / "no_init" / "__init__.py").write_text("")
+        assert "no_init" in manager.discover_plugins()
+        assert scans == [2]
+
+    def test_recent_changes_are_not_cached(self, plugins_dir, monkeypatch):
+        """Snapshots inside the coarse-mtime window are rescanned every time"""
+        manager = PluginManager(str(plugins_dir), use_rust=False)
+        scans = _count_scans(manager, monkeypatch)
+
+        manager.discover_plugins()
+        manager.discover_plugins()
+        assert scans == [2]
+
+
+def _age_tree(root):
+    """Move the mtimes of a plugins directory and its subdirectories back"""
+    old = time.time() - 60
+    for path in [root, *root.iterdir()]:
+        os.utime(path, (old, old))
+
+
+def _count_scans(manager, monkeypatch):
+    """Count calls to the os.scandir discovery scan"""
+    scans = [0]
+    scan = manager._scan_plugins_dir
+
+    def counting_scan():
+        scans[0] += 1
+        return scan()
+
+    monkeypatch.setattr(
+        PluginManager, "_scan_plugins_dir", lambda self: counting_scan()
+    )
+    return scans
+
+
+BUILTIN_PLUGINS = {
+    "seo": SEOPlugin,
+    "analytics": AnalyticsPlugin,
+    "social": SocialMetaPlugin,
+}
+
+OPTIONS = {
+    "tracking_id": "G-TEST",
+    "title": "Title & <more>",
+    "description": "Description",
+    "image": "https://example.com/og.png",
+    "url": "https://example.com/",
+}
+
+DOCUMENTS = [
+    "<html><head><title>T</title></head><body><p>a &amp; b & c</p></body></html>",
+    '<html><head lang="en"><title>T</title></head><body></body></html>',
+    '<html><head><meta charset="utf-8"><title>T</title></head><body></body></html>',
+    "<!DOCTYPE html><html><head></head><body><script async src=x.js></script>"
+    "</body></html>",
+    "<div><p>Fragment &copy; 2024</p>\n  <span>no head</span></div>",
+    "<p>only opening <head> tag</p>",
+    "<html><head><title>Привет</title></head><body>café</body></html>",
+    "plain text",
+    "",
+]
+
+
+class StopPlugin(PluginInterface):
+    NAME = "Stop"
+
+    def process(self, content, options=None):
+        raise PluginShortCircuit("stopped")
+
+
+class UpperTitlePlugin(PluginInterface):
+    """Third-party style plugin without a process_bytes override"""
+
+    NAME = "Upper Title"
+
+    def process(self, content, options=None):
+        return content.replace("<title>", "<title>É ")
+
+
+class DuckTypedPlugin:
+    """Plugin object that does not subclass PluginInterface"""
+
+    def get_name(self):
+        return "Duck"
+
+    def get_version(self):
+        return "1.0.0"
+
+    def get_description(self):
+        return "Duck-typed plugin"
+
+    def process(self, content, options=None):
+        return content + "<!-- duck -->"
+
+
+class ThreadRecordingPlugin(PluginInterface):
+    NAME = "Thread Recorder"
+
+    def __init__(self):
+        self.thread_ids = []
+
+    def process(self, content, options=None):
+        self.thread_ids.append(threading.get_ident())
+        return content
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = PluginManager(str(tmp_path))
+    for name, plugin_class in BUILTIN_PLUGINS.items():
+        manager.loaded_plugins[name] = plugin_class()
+        manager.enable_plugin(name)
+    return manager
+
+
+def _apply_sequentially(content, options):
+    """Reference result: each plugin's process() applied in plan order"""
+    for plugin_class in BUILTIN_PLUGINS.values():
+        content = plugin_class().process(content, options)
+    return content
+
+
+class TestPluginPipeline:
+    """Test that every processing entry point gives the same result"""
+
+    @pytest.mark.parametrize("content", DOCUMENTS)
+    def test_process_content_matches_plugin_process(self, manager, content):
+        """process_content only applies the plugins' string transforms"""
+        processed, applied = manager.process_content(content, options=OPTIONS)
+        assert processed == _apply_sequentially(content, OPTIONS)
+        assert applied == list(BUILTIN_PLUGINS)
+
+    def test_process_content_leaves_markup_untouched(self, manager):
+        """Documents are never re-serialized by a parser"""
+        fragment = DOCUMENTS[4]
+        assert manager.process_content(fragment, options=OPTIONS)[0] == fragment
+
+        document = DOCUMENTS[0]
+        processed, _ = manager.process_content(document, ["seo"])
+        assert processed == document.replace(
+            "<head>",
+            '<head>\n    <meta charset="UTF-8">'
+            '\n    <meta name="viewport" content="width=device-width, '
+            'initial-scale=1.0">',
+        )
+        assert "a &amp; b & c" in processed
+
+    @pytest.mark.parametrize("content", DOCUMENTS)
+    def test_process_content_async_matches(self, manager, content):
+        """The async entry point returns exactly what process_content does"""
+        result = asyncio.run(manager.process_content_async(content, options=OPTIONS))
+        assert result == manager.process_content(content, options=OPTIONS)
+
+    def test_process_content_async_keeps_plan_order(self, manager):
+        """Head injectors after a short-circuiting plugin are not applied"""
+        manager.loaded_plugins["stop"] = StopPlugin()
+        manager.enable_plugin("stop")
+        plan = ["stop", "seo", "analytics", "social"]
+
+        result = asyncio.run(manager.process_content_async(DOCUMENTS[0], plan, OPTIONS))
+        assert result == ("stopped", ["stop"])
+        assert result == manager.process_content(DOCUMENTS[0], plan, OPTIONS)
+
+    def test_process_content_async_runs_off_the_event_loop(self, manager):
+        """Plugins run in a worker thread, not on the event loop thread"""
+        recorder = ThreadRecordingPlugin()
+        manager.loaded_plugins["recorder"] = recorder
+        manager.enable_plugin("recorder")
+
+        async def run():
+            result = await manager.process_content_async(DOCUMENTS[0], ["recorder"])
+            return result, threading.get_ident()
+
+        result, loop_thread = asyncio.run(run())
+        assert result == (DOCUMENTS[0], ["recorder"])
+        assert recorder.thread_ids and loop_thread not in recorder.thread_ids
+
+    def test_process_batch_matches_process_content(self, manager):
+        """process_batch returns a process_content result per document"""
+        manager.loaded_plugins["stop"] = StopPlugin()
+        manager.enable_plugin("stop")
+
+        for plan in (None, ["seo", "stop", "social"]):
+            assert manager.process_batch(DOCUMENTS, plan, OPTIONS) == [
+                manager.process_content(content, plan, OPTIONS) for content in DOCUMENTS
+            ]
+
+    @pytest.mark.parametrize("plan", [None, ["seo", "stop", "social"]])
+    def test_process_content_bytes_matches(self, manager, plan):
+        """process_content_bytes returns the encoded process_content result"""
+        manager.loaded_plugins["stop"] = StopPlugin()
+        manager.enable_plugin("stop")
+
+        for content in DOCUMENTS:
+            processed, applied = manager.process_content(content, plan, OPTIONS)
+            assert manager.process_content_bytes(
+                content.encode("utf-8"), plan, OPTIONS
+            ) == (processed.encode("utf-8"), applied)
+
+    def test_process_content_bytes_default_fallback(self, manager):
+        """Plugins without their own process_bytes go through process()"""
+        manager.loaded_plugins["upper"] = UpperTitlePlugin()
+        manager.loaded_plugins["duck"] = DuckTypedPlugin()
+        manager.enable_plugin("upper")
+        manager.enable_plugin("duck")
+        plan = ["upper", "seo", "duck", "social"]
+
+        for content in DOCUMENTS:
+            processed, applied = manager.process_content(content, plan, OPTIONS)
+            assert applied == plan
+            assert manager.process_content_bytes(
+                content.encode("utf-8"), plan, OPTIONS
+            ) == (processed.encode("utf-8"), applied)
+
+    def test_base_process_bytes_uses_process(self):
+        """The PluginInterface.process_bytes default edits the buffer in place"""
+        data = bytearray("<title>Hi</title>".encode("utf-8"))
+        UpperTitlePlugin().process_bytes(data)
+        assert data.decode("utf-8") == "<title>É Hi</title>"
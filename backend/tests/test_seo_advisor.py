@@ -0,0 +1,192 @@
+import copy
+
+import pytest
+from bs4 import BeautifulSoup
+
+from app.modules.seo import advisor
+from app.modules.seo.advisor import _scan_keywords
+
+TEXT = "aaaa banana bandana ana nab anaana seo seo-friendly page " * 3
+
+FEW_KEYWORDS = ("ana", "aa", "seo", "", "missing")
+MANY_KEYWORDS = (
+    FEW_KEYWORDS
+    + tuple(f"kw{i}" for i in range(20))
+    + (
+        "an",
+        "na",
+        "banana",
+        "page ",
+    )
+)
+
+
+class TestScanKeywords:
+    """Test keyword counting against str.count / str.find"""
+
+    @pytest.mark.parametrize("keywords", [FEW_KEYWORDS, MANY_KEYWORDS])
+    def test_matches_str_count(self, keywords):
+        """Both the str.count and the automaton branch give the same counts"""
+        expected = {kw: (TEXT.count(kw), TEXT.find(kw)) for kw in keywords}
+        assert _scan_keywords(TEXT, keywords) == expected
+
+    def test_automaton_built_once_per_keyword_set(self):
+        """Repeated scans reuse the cached automaton"""
+        if not advisor.ahocorasick_available:
+            pytest.skip("pyahocorasick is not installed")
+        advisor._keyword_automaton.cache_clear()
+        for _ in range(3):
+            _scan_keywords(TEXT, MANY_KEYWORDS)
+        info = advisor._keyword_automaton.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+
+PAGE = """<html><head><title>SEO testing page for the advisor cache</title></head>
+<body><h1>Advisor cache</h1><p>SEO advisor content about caching results.</p></body>
+</html>"""
+
+
+class TestAnalysisCache:
+    """Test the analyze_and_recommend result cache"""
+
+    def test_mutating_result_does_not_change_cache(self):
+        """Results from both a miss and a hit are independent of the cache"""
+        seo_advisor = advisor.SEOAdvisor()
+        first = seo_advisor.analyze_and_recommend(PAGE, ["seo"])
+        snapshot = copy.deepcopy(first)
+
+        first["overall_score"] = -1
+        first["recommendations"].clear()
+        first["analysis"].clear()
+
+        second = seo_advisor.analyze_and_recommend(PAGE, ["seo"])
+        assert second == snapshot
+
+        second["analysis"].clear()
+        assert seo_advisor.analyze_and_recommend(PAGE, ["seo"]) == snapshot
+
+
+def _analysis(flags):
+    """Minimal "analysis" dict for the overall score, one penalty per flag bit"""
+    return {
+        "basic": {
+            "title": {"issues": ["title"] if flags & 1 else []},
+            "meta_description": {"issues": ["meta"] if flags & 2 else []},
+            "headings": {"issues": ["h1"] if flags & 4 else []},
+            "images": {"missing_alt": 2 if flags & 8 else 0},
+        },
+        "keywords": {
+            "keyword_stuffing_risk": {
+                "risk_level": ("none", "low", "medium", "high")[(flags >> 4) & 3]
+            }
+        },
+        "readability": {"flesch_reading_ease": 42.5 if flags & 64 else 75.0},
+        "structure": {},
+        "technical": {
+            "meta_tags": {"has_viewport": not flags & 128},
+            "has_lang_attribute": not flags & 256,
+        },
+    }
+
+
+class TestOverallScoreBatch:
+    """Test batch scoring against the per-page overall score"""
+
+    @pytest.mark.parametrize("count", [5, 32, 512])
+    def test_batch_matches_per_page(self, count):
+        """Small batches and the numpy path (32+ pages) give per-page scores"""
+        seo_advisor = advisor.SEOAdvisor()
+        # The first page gets every penalty, so its score is clamped to 0
+        pages = [_analysis((511 - i * 37) % 512) for i in range(count)]
+
+        expected = [
+            seo_advisor._calculate_overall_score(
+                page["basic"],
+                page["keywords"],
+                page["readability"],
+                page["structure"],
+                page["technical"],
+            )
+            for page in pages
+        ]
+        scores = seo_advisor._calculate_overall_score_batch(pages)
+        assert scores == expected
+        assert all(type(score) is int for score in scores)
+        assert scores[0] == 0
+
+    def test_numpy_branch_matches_pure_python(self, monkeypatch):
+        """The numpy branch gives the same scores as the pure-Python branch"""
+        pytest.importorskip("numpy")
+        assert advisor.numpy_available
+        seo_advisor = advisor.SEOAdvisor()
+        pages = [_analysis(i) for i in range(512)]
+
+        with_numpy = seo_advisor._calculate_overall_score_batch(pages)
+        monkeypatch.setattr(advisor, "numpy_available", False)
+        assert seo_advisor._calculate_overall_score_batch(pages) == with_numpy
+
+
+SEO_PARAGRAPH = (
+    "Search engine optimization (SEO) is the process of improving the quality and "
+    "quantity of website traffic to a website or a web page from search engines. "
+    'SEO targets unpaid traffic (known as "natural" or "organic" results) rather '
+    "than direct traffic or paid traffic. Unpaid traffic may originate from "
+    "different kinds of searches, including image search, video search, academic "
+    "search, news search, and industry-specific vertical search engines."
+)
+RELEASE_NOTE = (
+    "Version 2.0 was released in 2023. It has 15 new features! Do you like it? Yes."
+)
+HYPHENATED = (
+    "seo-friendly pages don't rank by magic. "
+    "They're well-structured, fast-loading and up-to-date."
+)
+
+
+class TestReadabilityScores:
+    """Test Flesch scores against the values textstat gives"""
+
+    @pytest.mark.parametrize(
+        "text, scores",
+        [
+            (SEO_PARAGRAPH, (40.69, 13.1)),
+            (RELEASE_NOTE, (99.94, 0.6)),
+            (HYPHENATED, (48.97, 7.8)),
+            ("Hi. Ok.", (120.21, -3.1)),
+            ("   ", (206.84, -15.7)),
+            ("", (0, 0)),
+        ],
+    )
+    def test_pinned_scores(self, text, scores):
+        """Hyphenated words count once and halves round away from zero"""
+        assert advisor._readability_scores(text) == scores
+
+    @pytest.mark.parametrize("text", [SEO_PARAGRAPH, RELEASE_NOTE, HYPHENATED])
+    def test_matches_textstat(self, text):
+        """Scores equal textstat's when it is installed"""
+        textstat = pytest.importorskip("textstat")
+        assert advisor._readability_scores(text) == (
+            textstat.flesch_reading_ease(text),
+            textstat.flesch_kincaid_grade(text),
+        )
+
+
+class TestCallerSoup:
+    """Test that a soup passed by the caller is left untouched"""
+
+    HTML = (
+        "<html><head></head><body><h1>Page</h1>"
+        '<p>Text with an image <img src="a.png"></p></body></html>'
+    )
+
+    def test_auto_fixes_do_not_modify_caller_soup(self):
+        """Auto-fixes go to a copy; the result matches a self-parsed run"""
+        soup = BeautifulSoup(self.HTML, advisor.HTML_PARSER)
+        before = str(soup)
+
+        result = advisor.SEOAdvisor().analyze_and_recommend(self.HTML, soup=soup)
+        assert str(soup) == before
+
+        expected = advisor.SEOAdvisor().analyze_and_recommend(self.HTML)
+        assert result["improved_html"] == expected["improved_html"]
+        assert result["improved_html"] != self.HTML
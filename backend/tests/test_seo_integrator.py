@@ -0,0 +1,68 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from app.modules.seo.advisor import HTML_PARSER, SEOAdvisor
+from app.modules.seo.integrator import SEOIntegrator
+
+JSON_LD_PAGE = """<html lang="en"><head><title>Structured data page for SEO tests</title>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "Article", "headline": "jsonldonly"}
+</script>
+<style>.hidden { display: none; }</style>
+</head><body><h1>Structured data</h1><p>Visible SEO text about structured data.</p>
+<script>var scriptonly = 1;</script></body></html>"""
+
+JOBS = [
+    {
+        "html": JSON_LD_PAGE,
+        "target_keywords": ["seo"],
+    },
+    {
+        "html": "<html><head><title>x</title></head><body><h1>A</h1><p>text seo</p></body></html>",
+        "target_keywords": ["seo", "text"],
+        "content_context": {"title": "Short", "category": "guides"},
+    },
+    {
+        "html": "<div><p>Fragment without head</p><img src='a.png'></div>",
+        "auto_apply": False,
+    },
+    {
+        "html": "<html><head></head><body></body></html>",
+        "target_audience": "technical",
+    },
+]
+
+
+class TestJsonLdDetection:
+    """Test that text extraction keeps scripts visible to the technical analysis"""
+
+    def test_json_ld_is_counted(self):
+        """JSON-LD scripts are found after the text has been extracted"""
+        result = SEOAdvisor().analyze_and_recommend(JSON_LD_PAGE, ["seo"])
+        structured_data = result["analysis"]["technical"]["structured_data"]
+        assert structured_data["json_ld_count"] == 1
+        assert structured_data["has_schema_org"] is True
+
+    def test_script_text_is_not_page_text(self):
+        """Script and style contents stay out of the extracted text"""
+        soup = BeautifulSoup(JSON_LD_PAGE, HTML_PARSER)
+        text, words, _ = SEOAdvisor()._extract_text(soup)
+        assert "Visible SEO text" in text
+        for hidden in ("jsonldonly", "scriptonly", "display"):
+            assert hidden not in words
+
+
+class TestBatchIntegrate:
+    """Test batch integration against one-by-one integration"""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_batch_matches_single_pages(self, workers):
+        """Results come back in job order and equal the single-page results"""
+        expected = [
+            SEOIntegrator().integrate_seo_recommendations(**job) for job in JOBS
+        ]
+        assert SEOIntegrator.batch_integrate(JOBS, workers=workers) == expected
+
+    def test_empty_batch(self):
+        """An empty batch returns no results without starting a pool"""
+        assert SEOIntegrator.batch_integrate([]) == []